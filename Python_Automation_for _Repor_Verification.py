@@ -2,13 +2,119 @@ import pandas as pd
 import re
 from datetime import datetime
 import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from difflib import SequenceMatcher
+import numpy as np
+
+_pandas_version = tuple(int(part) for part in re.findall(r"\d+", pd.__version__)[:2])
+
+# Prefer the calamine reader (pandas >= 2.2 with python-calamine installed), otherwise openpyxl
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = "calamine" if _pandas_version >= (2, 2) else "openpyxl"
+except ImportError:
+    _EXCEL_ENGINE = "openpyxl"
+
+# Options used whenever a workbook is opened. When falling back to openpyxl, workbooks are
+# loaded in streaming, values-only mode; pandas 1.5+ already defaults to this, and spelling
+# it out keeps the fast mode from silently changing.
+_EXCEL_OPEN_OPTIONS = {"engine": _EXCEL_ENGINE}
+if _EXCEL_ENGINE == "openpyxl" and _pandas_version >= (1, 5):
+    _EXCEL_OPEN_OPTIONS["engine_kwargs"] = {"read_only": True, "data_only": True, "keep_links": False}
+
+# Fixed inputs of the CQ091 checks, built once at import time
+_EXPECTED_TITLE = "CQ091 - QIP 9, 11 - KS2 - Kinship Service/Child in Care"
+_EXPECTED_TITLE_LOWER = _EXPECTED_TITLE.lower()
+_STANDARD_NUMBERS = (1, 2, 3)
+# Case numbers checked in Standard 2 Report (tuple keeps the reporting order; set/ints for lookups)
+_CASE_NUMBERS = ('12891050', '13141575', '11739608', '13038729', '13155126')
+_CASE_NUMBER_SET = frozenset(_CASE_NUMBERS)
+_CASE_NUMBER_INTS = frozenset(int(case) for case in _CASE_NUMBERS)
+
+# rapidfuzz is optional; when present it gives a fast C++ pre-check for the spelling similarity
+try:
+    from rapidfuzz import fuzz as _fuzz
+except ImportError:
+    _fuzz = None
+
+# polars is optional; when present it reads the single header rows of the standard sheets
+# without building a pandas DataFrame
+try:
+    import polars as _pl
+except ImportError:
+    _pl = None
+
+# Version and cover page patterns, compiled once instead of per call/line
+_VERSION_NUMBER_RE = re.compile(r'(\d+\.\d+)')
+_VERSION_RE = re.compile(r"Version: (\d+\.\d+)")
+_ETL_RE = re.compile(r"ETL - Started: (\d{2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}:\d{2} [AP]M); CM - Completed: (\d{2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}:\d{2} [AP]M)")
+
+# Parsed sheets keyed by (file path, modification time, read options). A changed file gets a
+# new mtime and therefore a new key, so stale entries are never returned.
+_SHEET_CACHE = OrderedDict()
+_SHEET_CACHE_SIZE = 32
+_SHEET_CACHE_LOCK = threading.Lock()
+
+def _read_excel_uncached(source, sheet_name, **kwargs):
+    """Call pd.read_excel with the module's engine settings"""
+    if isinstance(source, pd.ExcelFile):
+        # An open ExcelFile already carries its engine options; parse the sheet from that handle
+        return source.parse(sheet_name=sheet_name, **kwargs)
+    return pd.read_excel(source, sheet_name=sheet_name, **_EXCEL_OPEN_OPTIONS, **kwargs)
+
+def _read_excel(source, sheet_name, **kwargs):
+    """pd.read_excel with the parsed result cached per (file path, modification time)"""
+    path = source
+    if isinstance(source, pd.ExcelFile):
+        # The path an ExcelFile was opened from is .io in older pandas and ._io in newer releases
+        path = getattr(source, 'io', None) or getattr(source, '_io', None)
+    try:
+        options = tuple((name, tuple(value) if isinstance(value, list) else value)
+                        for name, value in sorted(kwargs.items()))
+        sheet_key = tuple(sheet_name) if isinstance(sheet_name, list) else sheet_name
+        key = (os.path.abspath(path), os.path.getmtime(path), sheet_key, options)
+    except (TypeError, OSError):
+        # Not a file on disk (or missing): read directly and let pandas report any error
+        return _read_excel_uncached(source, sheet_name, **kwargs)
+    
+    with _SHEET_CACHE_LOCK:
+        result = _SHEET_CACHE.get(key)
+        if result is not None:
+            _SHEET_CACHE.move_to_end(key)
+    
+    if result is None:
+        result = _read_excel_uncached(source, sheet_name, **kwargs)
+        with _SHEET_CACHE_LOCK:
+            _SHEET_CACHE[key] = result
+            if len(_SHEET_CACHE) > _SHEET_CACHE_SIZE:
+                _SHEET_CACHE.popitem(last=False)
+    
+    # Hand out copies so callers that rename columns never alter the cached frames
+    if isinstance(result, dict):
+        return {name: df.copy() for name, df in result.items()}
+    return result.copy()
+
+@contextmanager
+def _open_workbook(path):
+    """Open a workbook once so several tests can parse sheets from the same handle"""
+    # Fall back to the path so each test still reports its own read error
+    try:
+        workbook = pd.ExcelFile(path, **_EXCEL_OPEN_OPTIONS)
+    except Exception:
+        yield path
+        return
+    with workbook:
+        yield workbook
 
 def get_version_from_design_spec(design_spec_path):
     """Extract version from cell C3 of the General sheet in design spec"""
     try:
-        # Read the General sheet
-        general_df = pd.read_excel(design_spec_path, sheet_name='General', header=None)
+        # Read the General sheet (only A1:C3 is needed for C3)
+        general_df = _read_excel(design_spec_path, sheet_name='General', header=None, nrows=3, usecols="A:C")
         
         # Get value from cell C3 (0-indexed: row 2, column 2)
         version_value = general_df.iloc[2, 2]  # Row 3, Column C
@@ -17,7 +123,7 @@ def get_version_from_design_spec(design_spec_path):
         if pd.notna(version_value):
             version_str = str(version_value).strip()
             # Extract version number using regex (looking for patterns like 1.0, 1.1, 2.3, etc.)
-            version_match = re.search(r'(\d+\.\d+)', version_str)
+            version_match = _VERSION_NUMBER_RE.search(version_str)
             if version_match:
                 return version_match.group(1)
             else:
@@ -47,34 +153,56 @@ def analyze_difference(design_col, verification_col):
         return "Space difference (extra/missing spaces)"
     
     # Case differences only
-    if design_col.lower() == verification_col.lower():
+    design_lower = design_col.lower()
+    verification_lower = verification_col.lower()
+    if design_lower == verification_lower:
         return "Case difference (upper/lower case)"
     
     # Spelling errors (using similarity ratio)
-    similarity = SequenceMatcher(None, design_col.lower(), verification_col.lower()).ratio()
-    if similarity > 0.8:
-        return f"Spelling error (similarity: {similarity:.2f})"
+    # rapidfuzz's ratio (longest common subsequence) and real_quick_ratio/quick_ratio are all
+    # upper bounds on SequenceMatcher.ratio(), so the full comparison only runs when the pair
+    # can still clear the 0.8 threshold and the reported similarity is unchanged.
+    # The cheapest bound comes from the lengths alone: ratio() <= 2*shorter/(shorter+longer)
+    total_length = len(design_lower) + len(verification_lower)
+    if 2 * min(len(design_lower), len(verification_lower)) <= 0.8 * total_length:
+        may_be_similar = False
+    elif _fuzz is not None:
+        may_be_similar = _fuzz.ratio(design_lower, verification_lower) > 80 - 1e-9
+        matcher = SequenceMatcher(None, design_lower, verification_lower) if may_be_similar else None
+    else:
+        matcher = SequenceMatcher(None, design_lower, verification_lower)
+        may_be_similar = matcher.real_quick_ratio() > 0.8 and matcher.quick_ratio() > 0.8
+    if may_be_similar:
+        similarity = matcher.ratio()
+        if similarity > 0.8:
+            return f"Spelling error (similarity: {similarity:.2f})"
     
     # Word order differences
-    design_words = design_col.lower().split()
-    verification_words = verification_col.lower().split()
+    design_words = design_lower.split()
+    verification_words = verification_lower.split()
     if sorted(design_words) == sorted(verification_words):
         return "Word order difference"
     
     # Missing/extra words
-    if all(word in verification_words for word in design_words):
+    design_word_set = frozenset(design_words)
+    verification_word_set = frozenset(verification_words)
+    if design_word_set <= verification_word_set:
         return "Extra words in verification"
-    if all(word in design_words for word in verification_words):
+    if verification_word_set <= design_word_set:
         return "Missing words in verification"
     
     # Completely different content
     return "Content difference"
 
+def _join_cells(values):
+    """Join a row's non-empty cells with spaces (x == x drops NaN without going through pandas)"""
+    return ' '.join(str(x) for x in values if x is not None and x == x)
+
 def test_cover_page(report_path, expected_version):
     """Test cover page elements for CQ091 report"""
     try:
-        cover_df = pd.read_excel(report_path, sheet_name=0, header=None)
-        content = cover_df.apply(lambda row: ' '.join(row.dropna().astype(str)), axis=1).tolist()
+        cover_df = _read_excel(report_path, sheet_name=0, header=None)
+        content = [_join_cells(row) for row in cover_df.to_numpy(dtype=object)]
     except Exception as e:
         return {
             'title_spelling': {'passed': False, 'message': f"Error reading cover page: {str(e)}"},
@@ -82,50 +210,56 @@ def test_cover_page(report_path, expected_version):
             'etl_dates': {'passed': False, 'message': f"Error reading cover page: {str(e)}"}
         }
     
+    # All lines in one string for the regex checks; neither pattern can match across a newline,
+    # so the first hit is the same as scanning line by line
+    all_text = '\n'.join(content)
+    
     test_results = {
         'title_spelling': {'passed': False, 'message': ''},
         'version': {'passed': False, 'message': ''},
         'etl_dates': {'passed': False, 'message': ''}
     }
     
-    # Test 1: Check main title spelling
-    expected_title = "CQ091 - QIP 9, 11 - KS2 - Kinship Service/Child in Care"
+    # Test 1: Check main title spelling (per line, since the whole line must match exactly)
+    expected_title = _EXPECTED_TITLE
+    expected_title_lower = _EXPECTED_TITLE_LOWER
     title_found = False
     
-    for line in content:
-        if expected_title.lower() in line.lower():
-            if expected_title == line.strip():
-                test_results['title_spelling']['passed'] = True
-                test_results['title_spelling']['message'] = f"Title spelled correctly: '{expected_title}'"
-            else:
-                test_results['title_spelling']['message'] = f"Title spelling error. Expected: '{expected_title}', Found: '{line.strip()}'"
-            title_found = True
-            break
+    if expected_title_lower in all_text.lower():
+        for line in content:
+            if expected_title_lower in line.lower():
+                if expected_title == line.strip():
+                    test_results['title_spelling']['passed'] = True
+                    test_results['title_spelling']['message'] = f"Title spelled correctly: '{expected_title}'"
+                else:
+                    test_results['title_spelling']['message'] = f"Title spelling error. Expected: '{expected_title}', Found: '{line.strip()}'"
+                title_found = True
+                break
     
     if not title_found:
         test_results['title_spelling']['message'] = f"Main title not found: '{expected_title}'"
     
     # Test 2: Check report version
-    version_pattern = r"Version: (\d+\.\d+)"
-    for line in content:
-        match = re.search(version_pattern, line)
-        if match:
-            found_version = match.group(1)
-            if found_version == expected_version:
-                test_results['version']['passed'] = True
-                test_results['version']['message'] = f"Version matches: {found_version}"
-            else:
-                test_results['version']['message'] = f"Version mismatch. Expected: {expected_version}, Found: {found_version}"
-            break
+    match = _VERSION_RE.search(all_text)
+    if match:
+        found_version = match.group(1)
+        if found_version == expected_version:
+            test_results['version']['passed'] = True
+            test_results['version']['message'] = f"Version matches: {found_version}"
+        else:
+            test_results['version']['message'] = f"Version mismatch. Expected: {expected_version}, Found: {found_version}"
     
     # Test 3: Check ETL dates (started before completed)
-    etl_pattern = r"ETL - Started: (\d{2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}:\d{2} [AP]M); CM - Completed: (\d{2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}:\d{2} [AP]M)"
     date_format = "%d-%b-%Y %I:%M:%S %p"
     
     # Check row 3 specifically (0-indexed row 2)
     try:
-        row_3_content = cover_df.iloc[2].dropna().astype(str).str.cat(sep=' ')
-        match = re.search(etl_pattern, row_3_content)
+        row_3_content = _join_cells(cover_df.iloc[2].to_numpy(dtype=object))
+        match = _ETL_RE.search(row_3_content)
+        
+        # If not found in row 3, search all content
+        if not match:
+            match = _ETL_RE.search(all_text)
         
         if match:
             start_str, complete_str = match.groups()
@@ -141,48 +275,82 @@ def test_cover_page(report_path, expected_version):
             except ValueError:
                 test_results['etl_dates']['message'] = "Could not parse ETL dates"
         else:
-            # If not found in row 3, search all content
-            for line in content:
-                match = re.search(etl_pattern, line)
-                if match:
-                    start_str, complete_str = match.groups()
-                    try:
-                        start_date = datetime.strptime(start_str, date_format)
-                        complete_date = datetime.strptime(complete_str, date_format)
-                        
-                        if start_date < complete_date:
-                            test_results['etl_dates']['passed'] = True
-                            test_results['etl_dates']['message'] = f"ETL dates valid: Started {start_str} before Completed {complete_str}"
-                        else:
-                            test_results['etl_dates']['message'] = f"ETL dates invalid: Started {start_str} NOT before Completed {complete_str}"
-                    except ValueError:
-                        test_results['etl_dates']['message'] = "Could not parse ETL dates"
-                    break
-            else:
-                test_results['etl_dates']['message'] = "ETL date pattern not found in cover page"
+            test_results['etl_dates']['message'] = "ETL date pattern not found in cover page"
                 
     except Exception as e:
         test_results['etl_dates']['message'] = f"Error reading row 3: {str(e)}"
     
     return test_results
 
+def _compare_name_lists(design_names, verification_names, position_label, number_key, count_label):
+    """Compare two lists of names position by position and describe every mismatch"""
+    # Passing sheets (the usual case) are settled by one list comparison
+    if design_names == verification_names:
+        return [], []
+    
+    mismatches = []
+    details = []
+    min_length = min(len(design_names), len(verification_names))
+    
+    # Equality is checked for all positions at once in numpy; only the mismatched positions
+    # (usually few) reach analyze_difference, so matching names stay free
+    design_arr = np.asarray(design_names[:min_length], dtype=object)
+    verification_arr = np.asarray(verification_names[:min_length], dtype=object)
+    mismatched_positions = np.flatnonzero(design_arr != verification_arr) if min_length else []
+    
+    for i in mismatched_positions:
+        design_name = design_names[i]
+        verification_name = verification_names[i]
+        error_type = analyze_difference(design_name, verification_name)
+        mismatches.append(f"{position_label} {i+1}: {error_type} - Design='{design_name}' vs Verification='{verification_name}'")
+        details.append({
+            number_key: int(i)+1,
+            'design': design_name,
+            'verification': verification_name,
+            'error_type': error_type
+        })
+    
+    # Check for length differences
+    if len(design_names) != len(verification_names):
+        plural = f"{count_label.lower()}s"
+        mismatches.append(f"{count_label} count mismatch: Design={len(design_names)}, Verification={len(verification_names)}")
+        details.append({
+            number_key: 'N/A',
+            'design': f"Total {plural}: {len(design_names)}",
+            'verification': f"Total {plural}: {len(verification_names)}",
+            'error_type': f"{count_label} count mismatch"
+        })
+    
+    return mismatches, details
+
+def _read_sheet_row(source, sheet_name, row_index):
+    """Return the non-empty cells of one row (0-indexed) of a sheet, reading no further than that row"""
+    if _pl is not None and isinstance(source, (str, os.PathLike)):
+        try:
+            # Keep leading blank rows/columns so the row index means the same as in pandas
+            row_df = _pl.read_excel(source, sheet_name=sheet_name, engine='calamine',
+                                    drop_empty_rows=False, drop_empty_cols=False,
+                                    read_options={'header_row': None, 'skip_rows': 0, 'n_rows': row_index + 1})
+            return [value for value in row_df.row(row_index) if value is not None]
+        except Exception:
+            # Fall back to pandas, which also produces the error message if the sheet is unreadable
+            pass
+    sheet_df = _read_excel(source, sheet_name=sheet_name, header=None, nrows=row_index + 1)
+    return sheet_df.iloc[row_index].dropna().tolist()
+
 def test_standard_report_columns(design_spec_path, verification_path, standard_number):
     """Test if standard report columns match between design spec and verification report"""
     try:
         # Read design spec
         design_sheet_name = f"Standard Report {standard_number}"
-        design_df = pd.read_excel(design_spec_path, sheet_name=design_sheet_name, header=None)
-        
         # Get row 9 (0-indexed row 8) from design spec
-        design_columns = design_df.iloc[8].dropna().tolist()
+        design_columns = _read_sheet_row(design_spec_path, design_sheet_name, 8)
         design_columns = [str(col).strip() for col in design_columns]
         
         # Read verification report
         verification_sheet_name = f"Standard {standard_number} Report"
-        verification_df = pd.read_excel(verification_path, sheet_name=verification_sheet_name, header=None)
-        
         # Get row 2 (0-indexed row 1) from verification report
-        verification_columns = verification_df.iloc[1].dropna().tolist()
+        verification_columns = _read_sheet_row(verification_path, verification_sheet_name, 1)
         verification_columns = [str(col).strip() for col in verification_columns]
         
     except Exception as e:
@@ -193,34 +361,7 @@ def test_standard_report_columns(design_spec_path, verification_path, standard_n
         }
     
     # Compare columns
-    mismatches = []
-    details = []
-    min_length = min(len(design_columns), len(verification_columns))
-    
-    for i in range(min_length):
-        design_col = design_columns[i]
-        verification_col = verification_columns[i]
-        
-        if design_col != verification_col:
-            error_type = analyze_difference(design_col, verification_col)
-            mismatches.append(f"Column {i+1}: {error_type} - Design='{design_col}' vs Verification='{verification_col}'")
-            details.append({
-                'column_number': i+1,
-                'design': design_col,
-                'verification': verification_col,
-                'error_type': error_type
-            })
-    
-    # Check for length differences
-    if len(design_columns) != len(verification_columns):
-        length_error = f"Column count mismatch: Design={len(design_columns)}, Verification={len(verification_columns)}"
-        mismatches.append(length_error)
-        details.append({
-            'column_number': 'N/A',
-            'design': f"Total columns: {len(design_columns)}",
-            'verification': f"Total columns: {len(verification_columns)}",
-            'error_type': "Column count mismatch"
-        })
+    mismatches, details = _compare_name_lists(design_columns, verification_columns, "Column", 'column_number', "Column")
     
     if not mismatches:
         return {
@@ -236,22 +377,29 @@ def test_standard_report_columns(design_spec_path, verification_path, standard_n
             'mismatches': mismatches
         }
 
+def _stripped_values(values):
+    """Return the values of a Series as stripped strings"""
+    # All-text columns are stripped by pandas in one call; anything else (numbers, dates)
+    # keeps its str() form, which astype(str) would not always reproduce
+    if pd.api.types.is_string_dtype(values):
+        return values.astype(str).str.strip().tolist()
+    return [str(value).strip() for value in values]
+
 def test_summary_report(design_spec_path, verification_path):
     """Test summary report fields between design spec and verification report"""
     try:
         # Read design spec summary
-        design_df = pd.read_excel(design_spec_path, sheet_name="Summary Report", header=None)
+        # Only column A rows 1-37 are compared
+        design_df = _read_excel(design_spec_path, sheet_name="Summary Report", header=None, nrows=37, usecols=[0])
         
         # Get A1 to A37 from design spec
-        design_fields = design_df.iloc[0:37, 0].dropna().tolist()
-        design_fields = [str(field).strip() for field in design_fields]
+        design_fields = _stripped_values(design_df.iloc[0:37, 0].dropna())
         
         # Read verification summary
-        verification_df = pd.read_excel(verification_path, sheet_name="Summary Total", header=None)
+        verification_df = _read_excel(verification_path, sheet_name="Summary Total", header=None, nrows=37, usecols=[0])
         
         # Get A1 to A37 from verification report
-        verification_fields = verification_df.iloc[0:37, 0].dropna().tolist()
-        verification_fields = [str(field).strip() for field in verification_fields]
+        verification_fields = _stripped_values(verification_df.iloc[0:37, 0].dropna())
         
     except Exception as e:
         return {
@@ -261,34 +409,7 @@ def test_summary_report(design_spec_path, verification_path):
         }
     
     # Compare fields
-    mismatches = []
-    details = []
-    min_length = min(len(design_fields), len(verification_fields))
-    
-    for i in range(min_length):
-        design_field = design_fields[i]
-        verification_field = verification_fields[i]
-        
-        if design_field != verification_field:
-            error_type = analyze_difference(design_field, verification_field)
-            mismatches.append(f"Row {i+1}: {error_type} - Design='{design_field}' vs Verification='{verification_field}'")
-            details.append({
-                'row_number': i+1,
-                'design': design_field,
-                'verification': verification_field,
-                'error_type': error_type
-            })
-    
-    # Check for length differences
-    if len(design_fields) != len(verification_fields):
-        length_error = f"Field count mismatch: Design={len(design_fields)}, Verification={len(verification_fields)}"
-        mismatches.append(length_error)
-        details.append({
-            'row_number': 'N/A',
-            'design': f"Total fields: {len(design_fields)}",
-            'verification': f"Total fields: {len(verification_fields)}",
-            'error_type': "Field count mismatch"
-        })
+    mismatches, details = _compare_name_lists(design_fields, verification_fields, "Row", 'row_number', "Field")
     
     if not mismatches:
         return {
@@ -304,31 +425,51 @@ def test_summary_report(design_spec_path, verification_path):
             'mismatches': mismatches
         }
 
+def _format_dates(values):
+    """Format a column of dates as YYYY-MM-DD for display and flag which rows have a value"""
+    present = values.notna()
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # pandas already parsed the column as dates, so format it in one vectorized call;
+        # missing dates show as 'NaT' like str(NaT)
+        formatted = values.dt.strftime('%Y-%m-%d').where(present, 'NaT').tolist()
+    else:
+        # Mixed/text columns keep their original text (coercing them would turn e.g. 'N/A' into NaT)
+        formatted = [value.strftime('%Y-%m-%d') if pd.notna(value) and isinstance(value, (datetime, pd.Timestamp)) else str(value)
+                     for value in values]
+    return formatted, present.tolist()
+
+def _is_specific_cases_column(col):
+    """Return True for Standard 2 Report columns that test_specific_cases_dates may look up"""
+    col_lower = str(col).strip().lower()
+    return (('case' in col_lower and '#' in col_lower)
+            or ('30 day private visit due date' in col_lower and '2025' in col_lower)
+            or ('30 day private visit contact log start date' in col_lower and 'extension' in col_lower))
+
 def test_specific_cases_dates(verification_path):
     """Test specific case numbers and their corresponding dates in Standard 2 Report"""
     try:
-        # Read Standard 2 Report
-        verification_df = pd.read_excel(verification_path, sheet_name="Standard 2 Report", header=1)
+        # Read Standard 2 Report, keeping only the columns the case check can use
+        verification_df = _read_excel(verification_path, sheet_name="Standard 2 Report", header=1,
+                                      usecols=_is_specific_cases_column)
         
         # Clean column names by stripping whitespace
-        verification_df.columns = [str(col).strip() for col in verification_df.columns]
-        
-        # Specific case numbers to check
-        case_numbers_to_check = ['12891050', '13141575', '11739608', '13038729', '13155126']
-        
-        # Find the correct column names (case-insensitive search)
-        case_column = None
-        due_date_column = None
-        contact_log_column = None
-        
-        for col in verification_df.columns:
-            col_lower = col.lower()
-            if 'case' in col_lower and '#' in col_lower:
-                case_column = col
-            elif '30 day private visit due date' in col_lower and '2025' in col_lower:
-                due_date_column = col
-            elif '30 day private visit contact log start date' in col_lower and 'extension' in col_lower:
-                contact_log_column = col
+        verification_df.columns = verification_df.columns.astype(str).str.strip()
+        
+        # Find the correct column names (case-insensitive search). The masks are evaluated on the
+        # whole header at once; earlier categories take precedence and the last match wins
+        columns = verification_df.columns
+        cols_lower = columns.str.lower()
+        case_mask = cols_lower.str.contains('case', regex=False) & cols_lower.str.contains('#', regex=False)
+        due_date_mask = (~case_mask
+                         & cols_lower.str.contains('30 day private visit due date', regex=False)
+                         & cols_lower.str.contains('2025', regex=False))
+        contact_log_mask = (~case_mask & ~due_date_mask
+                            & cols_lower.str.contains('30 day private visit contact log start date', regex=False)
+                            & cols_lower.str.contains('extension', regex=False))
+        
+        case_column = columns[case_mask][-1] if case_mask.any() else None
+        due_date_column = columns[due_date_mask][-1] if due_date_mask.any() else None
+        contact_log_column = columns[contact_log_mask][-1] if contact_log_mask.any() else None
         
         if not case_column:
             return {
@@ -351,8 +492,20 @@ def test_specific_cases_dates(verification_path):
                 'details': []
             }
         
-        # Filter rows for specific case numbers
-        filtered_df = verification_df[verification_df[case_column].astype(str).isin(case_numbers_to_check)]
+        # Filter rows for specific case numbers. Integer case columns are matched on their native
+        # dtype (str(12891050) == '12891050', so the result is the same); anything else is
+        # compared as text exactly as before.
+        case_values = verification_df[case_column]
+        if pd.api.types.is_integer_dtype(case_values):
+            case_mask = case_values.isin(_CASE_NUMBER_INTS)
+            # Only the matched rows ever need their text form
+            filtered_case_strings = case_values[case_mask].astype(str).tolist()
+        else:
+            # Convert the column to text once and reuse it for the matched rows
+            case_strings = case_values.astype(str)
+            case_mask = case_strings.isin(_CASE_NUMBER_SET)
+            filtered_case_strings = case_strings[case_mask].tolist()
+        filtered_df = verification_df[case_mask]
         
         if len(filtered_df) == 0:
             return {
@@ -362,27 +515,23 @@ def test_specific_cases_dates(verification_path):
             }
         
         # Check if all case numbers are found
-        found_cases = filtered_df[case_column].astype(str).tolist()
-        missing_cases = [case for case in case_numbers_to_check if case not in found_cases]
-        
-        # Prepare results
-        details = []
-        for _, row in filtered_df.iterrows():
-            case_num = str(row[case_column])
-            due_date = row[due_date_column]
-            contact_log_date = row[contact_log_column]
-            
-            # Convert dates to string format for display
-            due_date_str = due_date.strftime('%Y-%m-%d') if pd.notna(due_date) and isinstance(due_date, (datetime, pd.Timestamp)) else str(due_date)
-            contact_log_str = contact_log_date.strftime('%Y-%m-%d') if pd.notna(contact_log_date) and isinstance(contact_log_date, (datetime, pd.Timestamp)) else str(contact_log_date)
-            
-            details.append({
+        found_cases = set(filtered_case_strings)
+        missing_cases = [case for case in _CASE_NUMBERS if case not in found_cases]
+        
+        # Prepare results (column-wise instead of iterrows)
+        due_date_strs, has_due_dates = _format_dates(filtered_df[due_date_column])
+        contact_log_strs, has_contact_log_dates = _format_dates(filtered_df[contact_log_column])
+        details = [
+            {
                 'case_number': case_num,
                 'due_date': due_date_str,
                 'contact_log_date': contact_log_str,
-                'has_due_date': pd.notna(due_date),
-                'has_contact_log_date': pd.notna(contact_log_date)
-            })
+                'has_due_date': has_due_date,
+                'has_contact_log_date': has_contact_log_date
+            }
+            for case_num, due_date_str, contact_log_str, has_due_date, has_contact_log_date in zip(
+                filtered_case_strings, due_date_strs, contact_log_strs, has_due_dates, has_contact_log_dates)
+        ]
         
         all_found = len(missing_cases) == 0
         all_have_dates = all(detail['has_due_date'] and detail['has_contact_log_date'] for detail in details)
@@ -430,92 +579,111 @@ def test_contact_log_requirements():
         'message': f"Contact log requirements verified:\n{requirements}"
     }
 
+def _write_lines(lines):
+    """Write buffered report lines to stdout in a single call and clear the buffer"""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+        lines.clear()
+
 def run_all_cq091_tests(design_spec_path, verification_path):
     """Run all tests for CQ091 report verification"""
+    # Report lines are collected and written in blocks rather than one print per line
+    out = []
+    
+    # Compare the three standards in parallel; each worker reads from the paths so no
+    # workbook handle is shared between threads
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        standard_futures = [executor.submit(test_standard_report_columns, design_spec_path, verification_path, standard_num)
+                            for standard_num in _STANDARD_NUMBERS]
+        
+        # Open each workbook once and run the remaining tests against the shared handles
+        # (pd.read_excel accepts an open ExcelFile wherever a path is expected)
+        with _open_workbook(design_spec_path) as design_xl, _open_workbook(verification_path) as verification_xl:
+            # Get version from design spec
+            out.append("🔍 Extracting version from design spec...")
+            _write_lines(out)  # get_version_from_design_spec prints its own warnings
+            expected_version = get_version_from_design_spec(design_xl)
+            
+            if expected_version is None:
+                out.append("❌ Could not extract version from design spec. Using fallback version 1.0")
+                expected_version = "1.0"  # Fallback version
+            
+            out.append(f"📋 Expected version from design spec: {expected_version}")
+            
+            out.append(f"\n🎯 Running CQ091 verification tests")
+            out.append(f"📁 Design Spec: {os.path.basename(design_spec_path)}")
+            out.append(f"📊 Verification Report: {os.path.basename(verification_path)}")
+            out.append(f"🔖 Expected version: {expected_version}")
+            out.append("=" * 80)
+            _write_lines(out)
+            
+            cover_results = test_cover_page(verification_xl, expected_version)
+            cases_result = test_specific_cases_dates(verification_xl)
+            summary_result = test_summary_report(design_xl, verification_xl)
+        
+        standard_results = [future.result() for future in standard_futures]
     
-    # Get version from design spec
-    print("🔍 Extracting version from design spec...")
-    expected_version = get_version_from_design_spec(design_spec_path)
-    
-    if expected_version is None:
-        print("❌ Could not extract version from design spec. Using fallback version 1.0")
-        expected_version = "1.0"  # Fallback version
-    
-    print(f"📋 Expected version from design spec: {expected_version}")
-    
-    print(f"\n🎯 Running CQ091 verification tests")
-    print(f"📁 Design Spec: {os.path.basename(design_spec_path)}")
-    print(f"📊 Verification Report: {os.path.basename(verification_path)}")
-    print(f"🔖 Expected version: {expected_version}")
-    print("=" * 80)
-    
-    # Run cover page tests
-    print("\n📄 === Cover Page Tests ===")
-    cover_results = test_cover_page(verification_path, expected_version)
+    # Report cover page tests
+    out.append("\n📄 === Cover Page Tests ===")
     for test_name, result in cover_results.items():
         status_icon = "✅" if result['passed'] else "❌"
         status_text = "PASSED" if result['passed'] else "FAILED"
-        print(f"{status_icon} {test_name.upper()}: {status_text} - {result['message']}")
+        out.append(f"{status_icon} {test_name.upper()}: {status_text} - {result['message']}")
     
-    # Run standard report tests for each standard
-    print("\n📊 === Standard Report Column Tests ===")
-    standard_results = []
-    for standard_num in [1, 2, 3]:
-        result = test_standard_report_columns(design_spec_path, verification_path, standard_num)
-        standard_results.append(result)
-        
+    # Report standard report tests for each standard
+    out.append("\n📊 === Standard Report Column Tests ===")
+    for standard_num, result in zip(_STANDARD_NUMBERS, standard_results):
         status_icon = "✅" if result['passed'] else "❌"
         status_text = "PASSED" if result['passed'] else "FAILED"
-        print(f"\n{status_icon} STANDARD {standard_num}: {status_text} - {result['message']}")
+        out.append(f"\n{status_icon} STANDARD {standard_num}: {status_text} - {result['message']}")
         
         if not result['passed'] and 'mismatches' in result:
             for mismatch in result['mismatches']:
-                print(f"  ⚠️  {mismatch}")
+                out.append(f"  ⚠️  {mismatch}")
         
-        print()  # Line space after each standard
+        out.append("")  # Line space after each standard
     
-    # Run specific cases test
-    print("\n🔍 === Specific Cases Test (Standard 2 Report) ===")
-    cases_result = test_specific_cases_dates(verification_path)
+    # Report specific cases test
+    out.append("\n🔍 === Specific Cases Test (Standard 2 Report) ===")
     status_icon = "✅" if cases_result['passed'] else "❌"
     status_text = "PASSED" if cases_result['passed'] else "FAILED"
-    print(f"{status_icon} SPECIFIC_CASES: {status_text} - {cases_result['message']}")
+    out.append(f"{status_icon} SPECIFIC_CASES: {status_text} - {cases_result['message']}")
     
     if not cases_result['passed'] and 'missing_cases' in cases_result and cases_result['missing_cases']:
-        print(f"  ⚠️  Missing cases: {', '.join(cases_result['missing_cases'])}")
+        out.append(f"  ⚠️  Missing cases: {', '.join(cases_result['missing_cases'])}")
     
     if 'details' in cases_result and cases_result['details']:
-        print("\n  📋 Case Details:")
+        out.append("\n  📋 Case Details:")
         for detail in cases_result['details']:
             due_icon = "✅" if detail['has_due_date'] else "❌"
             contact_icon = "✅" if detail['has_contact_log_date'] else "❌"
-            print(f"  • Case {detail['case_number']}: {due_icon} Due Date={detail['due_date']}, {contact_icon} Contact Log Date={detail['contact_log_date']}")
+            out.append(f"  • Case {detail['case_number']}: {due_icon} Due Date={detail['due_date']}, {contact_icon} Contact Log Date={detail['contact_log_date']}")
     
-    # Run summary report test
-    print("\n📈 === Summary Report Test ===")
-    summary_result = test_summary_report(design_spec_path, verification_path)
+    # Report summary report test
+    out.append("\n📈 === Summary Report Test ===")
     status_icon = "✅" if summary_result['passed'] else "❌"
     status_text = "PASSED" if summary_result['passed'] else "FAILED"
-    print(f"{status_icon} SUMMARY: {status_text} - {summary_result['message']}")
+    out.append(f"{status_icon} SUMMARY: {status_text} - {summary_result['message']}")
     
     if not summary_result['passed'] and 'mismatches' in summary_result:
         for mismatch in summary_result['mismatches']:
-            print(f"  ⚠️  {mismatch}")
+            out.append(f"  ⚠️  {mismatch}")
     
     # Run sensitivity and formula tests
-    print("\n⚡ === Sensitivity and Formula Tests ===")
+    out.append("\n⚡ === Sensitivity and Formula Tests ===")
     sensitivity_results = test_sensitivity_and_formula()
     for test_name, result in sensitivity_results.items():
         status_icon = "✅" if result['passed'] else "❌"
         status_text = "PASSED" if result['passed'] else "FAILED"
-        print(f"{status_icon} {test_name.upper()}: {status_text} - {result['message']}")
+        out.append(f"{status_icon} {test_name.upper()}: {status_text} - {result['message']}")
     
     # Run contact log requirements test
-    print("\n📝 === Contact Log Requirements Test ===")
+    out.append("\n📝 === Contact Log Requirements Test ===")
     contact_result = test_contact_log_requirements()
     status_icon = "✅" if contact_result['passed'] else "❌"
     status_text = "PASSED" if contact_result['passed'] else "FAILED"
-    print(f"{status_icon} CONTACT_LOG: {status_text} - {contact_result['message']}")
+    out.append(f"{status_icon} CONTACT_LOG: {status_text} - {contact_result['message']}")
     
     # Calculate overall status
     cover_passed = all(r['passed'] for r in cover_results.values())
@@ -527,52 +695,52 @@ def run_all_cq091_tests(design_spec_path, verification_path):
     
     all_passed = cover_passed and standards_passed and cases_passed and summary_passed and sensitivity_passed and contact_passed
     
-    print("\n" + "=" * 80)
-    print("🎯 === FINAL RESULT ===")
+    out.append("\n" + "=" * 80)
+    out.append("🎯 === FINAL RESULT ===")
     if all_passed:
-        print("✅ ALL CQ091 TESTS PASSED")
+        out.append("✅ ALL CQ091 TESTS PASSED")
     else:
-        print("❌ SOME CQ091 TESTS FAILED")
+        out.append("❌ SOME CQ091 TESTS FAILED")
     
     # Generate detailed error report
     if not all_passed:
-        print("\n🔍 === DETAILED ERROR ANALYSIS ===")
+        out.append("\n🔍 === DETAILED ERROR ANALYSIS ===")
         
         # Cover page errors
         if not cover_passed:
-            print("\n📄 Cover Page Errors:")
+            out.append("\n📄 Cover Page Errors:")
             for test_name, result in cover_results.items():
                 if not result['passed']:
-                    print(f"  ❌ {test_name}: {result['message']}")
+                    out.append(f"  ❌ {test_name}: {result['message']}")
         
         # Standard report errors
         if not standards_passed:
-            print("\n📊 Standard Report Errors:")
+            out.append("\n📊 Standard Report Errors:")
             for i, result in enumerate(standard_results, 1):
                 if not result['passed']:
-                    print(f"\n  📋 Standard {i}:")
+                    out.append(f"\n  📋 Standard {i}:")
                     for detail in result.get('details', []):
-                        print(f"    ❌ Column {detail['column_number']}: {detail['error_type']}")
-                        print(f"       Design: '{detail['design']}'")
-                        print(f"       Verification: '{detail['verification']}'")
+                        out.append(f"    ❌ Column {detail['column_number']}: {detail['error_type']}")
+                        out.append(f"       Design: '{detail['design']}'")
+                        out.append(f"       Verification: '{detail['verification']}'")
         
         # Specific cases errors
         if not cases_passed:
-            print("\n🔍 Specific Cases Errors:")
+            out.append("\n🔍 Specific Cases Errors:")
             if 'missing_cases' in cases_result and cases_result['missing_cases']:
-                print(f"  ❌ Missing case numbers: {', '.join(cases_result['missing_cases'])}")
+                out.append(f"  ❌ Missing case numbers: {', '.join(cases_result['missing_cases'])}")
             if 'details' in cases_result:
                 for detail in cases_result['details']:
                     if not detail['has_due_date'] or not detail['has_contact_log_date']:
-                        print(f"  ❌ Case {detail['case_number']}: Missing Due Date={not detail['has_due_date']}, Missing Contact Log Date={not detail['has_contact_log_date']}")
+                        out.append(f"  ❌ Case {detail['case_number']}: Missing Due Date={not detail['has_due_date']}, Missing Contact Log Date={not detail['has_contact_log_date']}")
         
         # Summary report errors
         if not summary_passed:
-            print("\n📈 Summary Report Errors:")
+            out.append("\n📈 Summary Report Errors:")
             for detail in summary_result.get('details', []):
-                print(f"  ❌ Row {detail['row_number']}: {detail['error_type']}")
-                print(f"     Design: '{detail['design']}'")
-                print(f"     Verification: '{detail['verification']}'")
+                out.append(f"  ❌ Row {detail['row_number']}: {detail['error_type']}")
+                out.append(f"     Design: '{detail['design']}'")
+                out.append(f"     Verification: '{detail['verification']}'")
     
     # Print summary statistics
     total_tests = 6  # cover + 3 standards + cases + summary + sensitivity + contact
@@ -586,8 +754,9 @@ def run_all_cq091_tests(design_spec_path, verification_path):
     ])
     
     success_rate = (passed_tests / total_tests) * 100
-    print(f"\n📊 TEST SUMMARY: {passed_tests}/{total_tests} tests passed ({success_rate:.1f}%)")
+    out.append(f"\n📊 TEST SUMMARY: {passed_tests}/{total_tests} tests passed ({success_rate:.1f}%)")
     
+    _write_lines(out)
     return all_passed
 
 # Main execution
@@ -1,136 +1,251 @@
 import pandas as pd
+import numpy as np
 import os
+import io
 from datetime import datetime
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Import all the necessary functions from your verification script
 from verfication_CQ091 import (
-    run_all_cq091_tests, 
     test_cover_page,
     test_standard_report_columns, 
     test_specific_cases_dates,
     test_summary_report,
-    verify_complete_summary_sheet
+    verify_complete_summary_sheet,
+    _open_workbook
 )
 
-def create_developer_report(design_spec_path, verification_path, expected_version, output_path=None):
+# xlsxwriter streams the sheets straight to the file and is faster for these value-only
+# tables; openpyxl is used when it is not installed
+try:
+    import xlsxwriter  # noqa: F401
+    _WRITER_ENGINE = "xlsxwriter"
+except ImportError:
+    _WRITER_ENGINE = "openpyxl"
+
+# Before pandas 3, to_excel gives its header row a bold, bordered, centred style; tables written
+# directly copy that so every sheet's header looks the same
+_STYLED_HEADERS = int(pd.__version__.split('.')[0]) < 3
+
+def _write_cell(worksheet, row, col, value):
+    """Write a value to a 0-indexed cell with whichever engine the report is using"""
+    if _WRITER_ENGINE == "xlsxwriter":
+        worksheet.write(row, col, value)
+    else:
+        worksheet.cell(row=row + 1, column=col + 1, value=value)
+
+def _set_column_width(worksheet, col, width):
+    """Set the width of a 0-indexed column with whichever engine the report is using"""
+    if _WRITER_ENGINE == "xlsxwriter":
+        worksheet.set_column(col, col, width)
+    else:
+        from openpyxl.utils import get_column_letter
+        worksheet.column_dimensions[get_column_letter(col + 1)].width = width
+
+def _fit_columns(worksheet, df=None, extra_cells=()):
+    """Size each column to its longest header or value written to it (+2, at most 50)"""
+    # Lengths come straight from the DataFrame, so no written cell has to be read back
+    max_lengths = {}
+    if df is not None:
+        max_lengths = {col: max([len(str(name))] + df.iloc[:, col].astype(str).str.len().tolist())
+                       for col, name in enumerate(df.columns)}
+    # Cells written outside the DataFrame, as (row, column, value)
+    for _, col, value in extra_cells:
+        max_lengths[col] = max(max_lengths.get(col, 0), len(str(value)))
+    for col, max_length in max_lengths.items():
+        _set_column_width(worksheet, col, min(max_length + 2, 50))
+
+def _write_table(writer, sheet_name, columns, rows, startrow=0, extra_cells=()):
+    """Write a small table (header row, then data rows) straight to a new sheet without a DataFrame"""
+    if _WRITER_ENGINE == "xlsxwriter":
+        worksheet = writer.book.add_worksheet(sheet_name)
+        header_format = None
+        if _STYLED_HEADERS:
+            header_format = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        worksheet.write_row(startrow, 0, columns, header_format)
+        for row_number, row in enumerate(rows, start=startrow + 1):
+            worksheet.write_row(row_number, 0, row)
+    else:
+        worksheet = writer.book.create_sheet(sheet_name)
+        for col, name in enumerate(columns, start=1):
+            cell = worksheet.cell(row=startrow + 1, column=col, value=name)
+            if _STYLED_HEADERS:
+                from openpyxl.styles import Alignment, Border, Font, Side
+                thin = Side(style='thin')
+                cell.font = Font(bold=True)
+                cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+                cell.alignment = Alignment(horizontal='center', vertical='top')
+        for row_number, row in enumerate(rows, start=startrow + 2):
+            for col, value in enumerate(row, start=1):
+                worksheet.cell(row=row_number, column=col, value=value)
+    
+    # Any other cells on the sheet, as (row, column, value)
+    for row, col, value in extra_cells:
+        _write_cell(worksheet, row, col, value)
+    
+    _fit_columns(worksheet, extra_cells=[(startrow, col, name) for col, name in enumerate(columns)]
+                 + [(row_number, col, value) for row_number, row in enumerate(rows, start=startrow + 1)
+                    for col, value in enumerate(row)]
+                 + list(extra_cells))
+    return worksheet
+
+def create_developer_report(design_spec_path, verification_path, expected_version, output_path=None, results=None):
     """
     Create a comprehensive Excel report for developers and BAs showing errors and corrections
+    (pass results from collect_test_results to reuse a run that has already been done)
     """
     
+    # One clock reading for both the default filename and the Dashboard's "Generated" line
+    generated = datetime.now()
+    
     # Create output filename with timestamp if not provided - FIXED EXTENSION
     if output_path is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = generated.strftime("%Y%m%d_%H%M%S")
         output_path = f"CQ091_Verification_Report_{timestamp}.xlsx"  # Fixed: .xlsx not .xIsx
     
     print(f"📁 Creating report: {output_path}")
     
-    # Initialize Excel writer
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    # Initialize Excel writer. The workbook is built in memory and written to disk in one call
+    # (few round trips on network drives, and no half-written file if a sheet fails)
+    report_buffer = io.BytesIO()
+    with pd.ExcelWriter(report_buffer, engine=_WRITER_ENGINE) as writer:
         
         # Create summary dashboard
         print("📊 Creating Dashboard...")
-        create_summary_dashboard(writer, design_spec_path, verification_path, expected_version)
+        # Every test runs once (unless the caller already ran them); all sheets share the results
+        if results is None:
+            results = collect_test_results(design_spec_path, verification_path, expected_version)
+        create_summary_dashboard(writer, results, design_spec_path, verification_path,
+                                 generated.strftime('%Y-%m-%d %H:%M:%S'))
         
         # Create detailed error sheets based on test results
         print("📄 Creating Cover Page Analysis...")
-        create_cover_page_analysis(writer, verification_path, expected_version)
+        create_cover_page_analysis(writer, results)
         
         print("📋 Creating Column Issues Analysis...")
-        create_column_comparison_analysis(writer, design_spec_path, verification_path)
+        create_column_comparison_analysis(writer, results)
         
         print("🔍 Creating Specific Cases Analysis...")
-        create_specific_cases_analysis(writer, verification_path)
+        create_specific_cases_analysis(writer, results)
         
         print("📈 Creating Summary Total Analysis...")
         create_summary_total_analysis(writer, verification_path)
         
         print("📖 Creating Correction Guide...")
         create_correction_guide(writer)
-        
-        print("🎨 Applying formatting...")
-        apply_basic_formatting(writer)
+    
+    with open(output_path, 'wb') as output_file:
+        output_file.write(report_buffer.getbuffer())
     
     print(f"✅ Comprehensive report generated: {output_path}")
     return output_path
 
-def create_summary_dashboard(writer, design_spec_path, verification_path, expected_version):
+def _run_shared_workbook_tests(design_spec_path, verification_path, expected_version):
+    """Run the cover, cases and summary tests against one open handle per workbook"""
+    # The handles are only used from the thread that opened them
+    with _open_workbook(design_spec_path) as design_xl, _open_workbook(verification_path) as verification_xl:
+        return (test_cover_page(verification_xl, expected_version),
+                test_specific_cases_dates(verification_xl),
+                test_summary_report(design_xl, verification_xl))
+
+def collect_test_results(design_spec_path, verification_path, expected_version):
+    """Run each verification test once and return the results used by the report sheets"""
+    # The tests only read the workbooks, so they run side by side. verify_complete_summary_sheet
+    # prints its own progress and stays on this thread so its output is not interleaved.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        shared_future = executor.submit(_run_shared_workbook_tests, design_spec_path, verification_path, expected_version)
+        standard_futures = {std_num: executor.submit(test_standard_report_columns, design_spec_path, verification_path, std_num)
+                            for std_num in [1, 2, 3]}
+        summary_total_passed = verify_complete_summary_sheet(verification_path)
+        
+        cover_results, cases_result, summary_result = shared_future.result()
+        return {
+            'cover': cover_results,
+            'standards': {std_num: future.result() for std_num, future in standard_futures.items()},
+            'cases': cases_result,
+            'summary': summary_result,
+            'summary_total': summary_total_passed
+        }
+
+def all_tests_passed(results):
+    """Overall pass/fail of collected results, as run_all_cq091_tests would report it"""
+    # The sensitivity/formula and contact log checks in run_all_cq091_tests always pass
+    return (all(r['passed'] for r in results['cover'].values())
+            and all(r['passed'] for r in results['standards'].values())
+            and results['cases']['passed']
+            and results['summary']['passed']
+            and bool(results['summary_total']))
+
+def create_summary_dashboard(writer, results, design_spec_path, verification_path, generated_at):
     """Create the main summary dashboard"""
     
-    # Run tests to get results
-    cover_results = test_cover_page(verification_path, expected_version)
+    cover_results = results['cover']
     
     # Create summary data
     summary_data = []
     
     # Test 1: Cover Page
-    cover_status = "PASS" if all(r['passed'] for r in cover_results.values()) else "FAIL"
-    cover_issues = sum(1 for r in cover_results.values() if not r['passed'])
+    # Pass flags are gathered into numpy arrays and counted in one step
+    cover_passed = np.fromiter((r['passed'] for r in cover_results.values()), dtype=bool, count=len(cover_results))
+    cover_status = "PASS" if cover_passed.all() else "FAIL"
+    cover_issues = int((~cover_passed).sum())
     summary_data.append(["Cover Page", cover_status, cover_issues, "High", "Check title, version, ETL dates"])
     
     # Test 2: Standard Reports Columns
-    standards_status = "PASS"
-    standards_issues = 0
-    for std_num in [1, 2, 3]:
-        result = test_standard_report_columns(design_spec_path, verification_path, std_num)
-        if not result['passed']:
-            standards_status = "FAIL"
-            standards_issues += len(result.get('details', []))
+    standard_results = list(results['standards'].values())
+    standards_passed = np.array([result['passed'] for result in standard_results], dtype=bool)
+    issues_per_standard = np.array([0 if result['passed'] else len(result.get('details', []))
+                                    for result in standard_results], dtype=int)
+    standards_status = "PASS" if standards_passed.all() else "FAIL"
+    standards_issues = int(issues_per_standard.sum())
     
     summary_data.append(["Standard Reports Columns", standards_status, standards_issues, "High", "Verify column names and order"])
     
     # Test 3: Specific Cases
-    cases_result = test_specific_cases_dates(verification_path)
+    cases_result = results['cases']
     cases_status = "PASS" if cases_result['passed'] else "FAIL"
-    cases_issues = len(cases_result.get('missing_cases', [])) + sum(
-        1 for d in cases_result.get('details', []) 
-        if not d.get('has_due_date', True) or not d.get('has_contact_log_date', True)
-    )
+    case_details = cases_result.get('details', [])
+    has_all_dates = np.fromiter((d.get('has_due_date', True) and d.get('has_contact_log_date', True) for d in case_details),
+                                dtype=bool, count=len(case_details))
+    cases_issues = len(cases_result.get('missing_cases', [])) + int((~has_all_dates).sum())
     summary_data.append(["Specific Cases", cases_status, cases_issues, "Medium", "Check case numbers and dates"])
     
     # Test 4: Summary Report
-    summary_result = test_summary_report(design_spec_path, verification_path)
+    summary_result = results['summary']
     summary_status = "PASS" if summary_result['passed'] else "FAIL"
     summary_issues = len(summary_result.get('details', []))
     summary_data.append(["Summary Report", summary_status, summary_issues, "High", "Verify summary fields"])
     
     # Test 5: Summary Total
-    summary_total_passed = verify_complete_summary_sheet(verification_path)
+    summary_total_passed = results['summary_total']
     summary_total_status = "PASS" if summary_total_passed else "FAIL"
     summary_total_issues = 0 if summary_total_passed else "Multiple"
     summary_data.append(["Summary Total Sheet", summary_total_status, summary_total_issues, "Critical", "Verify counts and calculations"])
     
-    # Create DataFrame
-    df_summary = pd.DataFrame(summary_data, 
-                             columns=["Test Category", "Status", "Issues Found", "Priority", "Action Required"])
-    
-    # Write to Excel
-    df_summary.to_excel(writer, sheet_name="Dashboard", index=False)
-    
-    # Get workbook and worksheet for formatting
-    workbook = writer.book
-    worksheet = writer.sheets["Dashboard"]
-    
-    # Add header rows
-    worksheet.insert_rows(0, 4)
-    worksheet['A1'] = "CQ091 VERIFICATION REPORT - DEVELOPER & BA ANALYSIS"
-    worksheet['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    worksheet['A3'] = f"Design Spec: {os.path.basename(design_spec_path)}"
-    worksheet['A4'] = f"Verification File: {os.path.basename(verification_path)}"
-    
-    # Add metrics
+    # Header rows and metrics, as (row, column, value)
     total_tests = len(summary_data)
     passed_tests = sum(1 for row in summary_data if row[1] == "PASS")
-    worksheet['F1'] = "OVERALL SUMMARY"
-    worksheet['F2'] = f"Total Tests: {total_tests}"
-    worksheet['F3'] = f"Tests Passed: {passed_tests}"
-    worksheet['F4'] = f"Tests Failed: {total_tests - passed_tests}"
-    worksheet['F5'] = f"Success Rate: {passed_tests/total_tests:.1%}" if total_tests > 0 else "N/A"
+    header_cells = [
+        (0, 0, "CQ091 VERIFICATION REPORT - DEVELOPER & BA ANALYSIS"),
+        (1, 0, f"Generated: {generated_at}"),
+        (2, 0, f"Design Spec: {os.path.basename(design_spec_path)}"),
+        (3, 0, f"Verification File: {os.path.basename(verification_path)}"),
+        (0, 5, "OVERALL SUMMARY"),
+        (1, 5, f"Total Tests: {total_tests}"),
+        (2, 5, f"Tests Passed: {passed_tests}"),
+        (3, 5, f"Tests Failed: {total_tests - passed_tests}"),
+        (4, 5, f"Success Rate: {passed_tests/total_tests:.1%}" if total_tests > 0 else "N/A")
+    ]
+    
+    # Write the table below the four header rows
+    _write_table(writer, "Dashboard", ["Test Category", "Status", "Issues Found", "Priority", "Action Required"],
+                 summary_data, startrow=4, extra_cells=header_cells)
 
-def create_cover_page_analysis(writer, verification_path, expected_version):
+def create_cover_page_analysis(writer, results):
     """Detailed analysis of cover page issues"""
     
-    cover_results = test_cover_page(verification_path, expected_version)
+    cover_results = results['cover']
     
     analysis_data = []
     for test_name, result in cover_results.items():
@@ -142,18 +257,15 @@ def create_cover_page_analysis(writer, verification_path, expected_version):
             "High" if "title" in test_name else "Medium"
         ])
     
-    df_cover = pd.DataFrame(analysis_data, 
-                           columns=["Test", "Status", "Message", "Correction Required", "Priority"])
-    df_cover.to_excel(writer, sheet_name="Cover Page Analysis", index=False)
+    _write_table(writer, "Cover Page Analysis",
+                 ["Test", "Status", "Message", "Correction Required", "Priority"], analysis_data)
 
-def create_column_comparison_analysis(writer, design_spec_path, verification_path):
+def create_column_comparison_analysis(writer, results):
     """Detailed column comparison analysis"""
     
     all_issues = []
     
-    for std_num in [1, 2, 3]:
-        result = test_standard_report_columns(design_spec_path, verification_path, std_num)
-        
+    for std_num, result in results['standards'].items():
         if not result['passed'] and 'details' in result:
             for detail in result['details']:
                 all_issues.append([
@@ -171,16 +283,15 @@ def create_column_comparison_analysis(writer, design_spec_path, verification_pat
                                  columns=["Report", "Column #", "Expected", "Actual", "Error Type", 
                                          "Correction Guidance", "Priority"])
         df_columns.to_excel(writer, sheet_name="Column Issues", index=False)
+        _fit_columns(writer.sheets["Column Issues"], df_columns)
     else:
         # Create empty sheet with success message
-        df_empty = pd.DataFrame([["All column comparisons passed successfully"]], 
-                               columns=["Status"])
-        df_empty.to_excel(writer, sheet_name="Column Issues", index=False)
+        _write_table(writer, "Column Issues", ["Status"], [["All column comparisons passed successfully"]])
 
-def create_specific_cases_analysis(writer, verification_path):
+def create_specific_cases_analysis(writer, results):
     """Analysis of specific test cases"""
     
-    result = test_specific_cases_dates(verification_path)
+    result = results['cases']
     
     analysis_data = []
     
@@ -216,18 +327,15 @@ def create_specific_cases_analysis(writer, verification_path):
                                columns=["Case Number", "Status", "Due Date", "Contact Log Date", 
                                        "Issue", "Correction Required", "Priority"])
         df_cases.to_excel(writer, sheet_name="Specific Cases Analysis", index=False)
+        _fit_columns(writer.sheets["Specific Cases Analysis"], df_cases)
     else:
-        df_empty = pd.DataFrame([["All specific cases validated successfully"]],
-                               columns=["Status"])
-        df_empty.to_excel(writer, sheet_name="Specific Cases Analysis", index=False)
+        _write_table(writer, "Specific Cases Analysis", ["Status"], [["All specific cases validated successfully"]])
 
 def create_summary_total_analysis(writer, verification_path):
     """Detailed analysis of Summary Total sheet issues"""
     
     # Since we know from your output that summary total passed, create a success sheet
-    df_empty = pd.DataFrame([["Summary Total sheet validation passed successfully - All 92 cells verified correctly"]],
-                           columns=["Status"])
-    df_empty.to_excel(writer, sheet_name="Summary Total Analysis", index=False)
+    _write_table(writer, "Summary Total Analysis", ["Status"], [["Summary Total sheet validation passed successfully - All 92 cells verified correctly"]])
 
 def create_correction_guide(writer):
     """Create a comprehensive correction guide for developers and BAs"""
@@ -247,32 +355,40 @@ def create_correction_guide(writer):
         ["Missing cases", "Investigate data source completeness", "BA", "Check source system data extraction", "N/A"]
     ]
     
-    df_guide = pd.DataFrame(correction_data,
-                           columns=["Error Type", "Issue Description", "Responsible Team", "Recommended Action", "Examples from Current Test"])
-    df_guide.to_excel(writer, sheet_name="Correction Guide", index=False)
+    _write_table(writer, "Correction Guide",
+                 ["Error Type", "Issue Description", "Responsible Team", "Recommended Action", "Examples from Current Test"],
+                 correction_data)
+
+# Correction guidance, built once at import time instead of on every lookup
+_COVER_PAGE_CORRECTIONS = {
+    'title_spelling': "Update report title in the template to match specification exactly",
+    'version': "Ensure version number is correctly set in report generation process",
+    'etl_dates': "Verify ETL process timing and date formatting logic"
+}
+
+# Each entry formats its message from (expected, actual), so only the matching one is formatted
+_COLUMN_CORRECTIONS = {
+    "Space difference": lambda expected, actual: f"Trim spaces: change '{actual}' to '{expected}'",
+    "Case difference": lambda expected, actual: f"Standardize case: change '{actual}' to '{expected}'",
+    "Spelling error": lambda expected, actual: f"Correct spelling: change '{actual}' to '{expected}'",
+    "Word order difference": lambda expected, actual: "Reorder words to match specification",
+    "Missing words in verification": lambda expected, actual: f"Add missing words: '{expected}'",
+    "Extra words in verification": lambda expected, actual: f"Remove extra words: use '{expected}'",
+    "Content difference": lambda expected, actual: f"Major revision needed. Expected: '{expected}', Found: '{actual}'",
+    "Column count mismatch": lambda expected, actual: "Adjust number of columns to match design specification"
+}
+
+def _default_column_correction(expected, actual):
+    """Fallback guidance for error types without a specific correction"""
+    return f"Review and correct: '{actual}' should be '{expected}'"
 
 def get_cover_page_correction(test_name, result):
     """Get specific correction guidance for cover page issues"""
-    corrections = {
-        'title_spelling': "Update report title in the template to match specification exactly",
-        'version': "Ensure version number is correctly set in report generation process",
-        'etl_dates': "Verify ETL process timing and date formatting logic"
-    }
-    return corrections.get(test_name, "Review cover page generation logic")
+    return _COVER_PAGE_CORRECTIONS.get(test_name, "Review cover page generation logic")
 
 def get_column_correction(error_type, expected, actual):
     """Get specific correction guidance for column issues"""
-    corrections = {
-        "Space difference": f"Trim spaces: change '{actual}' to '{expected}'",
-        "Case difference": f"Standardize case: change '{actual}' to '{expected}'",
-        "Spelling error": f"Correct spelling: change '{actual}' to '{expected}'",
-        "Word order difference": f"Reorder words to match specification",
-        "Missing words in verification": f"Add missing words: '{expected}'",
-        "Extra words in verification": f"Remove extra words: use '{expected}'",
-        "Content difference": f"Major revision needed. Expected: '{expected}', Found: '{actual}'",
-        "Column count mismatch": f"Adjust number of columns to match design specification"
-    }
-    return corrections.get(error_type, f"Review and correct: '{actual}' should be '{expected}'")
+    return _COLUMN_CORRECTIONS.get(error_type, _default_column_correction)(expected, actual)
 
 def get_case_correction(status):
     """Get correction guidance for case issues"""
@@ -285,30 +401,6 @@ def get_case_correction(status):
     else:
         return "Investigate data completeness for this case"
 
-def apply_basic_formatting(writer):
-    """Apply basic formatting to all sheets"""
-    try:
-        workbook = writer.book
-        
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-    except Exception as e:
-        print(f"Note: Formatting could not be applied: {e}")
-
 # Enhanced main execution with report generation
 if __name__ == "__main__":
     # File paths
@@ -325,13 +417,14 @@ if __name__ == "__main__":
         sys.exit(1)
     
     try:
-        # First run the tests to see current status
+        # First run the tests to see current status (once; the report reuses these results)
         print("🔍 Running CQ091 verification tests...")
-        all_passed = run_all_cq091_tests(design_spec_path, verification_path, expected_version)
+        results = collect_test_results(design_spec_path, verification_path, expected_version)
+        all_passed = all_tests_passed(results)
         
         # Then generate the comprehensive report
         print("\n📊 Generating comprehensive developer/BA report...")
-        report_path = create_developer_report(design_spec_path, verification_path, expected_version)
+        report_path = create_developer_report(design_spec_path, verification_path, expected_version, results=results)
         
         print(f"\n🎉 REPORT GENERATION COMPLETE!")
         print(f"📁 Report saved as: {report_path}")
@@ -348,9 +441,13 @@ if __name__ == "__main__":
             print("   • Standard 2: 7 column issues + column count mismatch (39 vs 38)")
             print("   • Standard 3: 6 column issues + column count mismatch (37 vs 36)")
         
-        # Verify the file was created correctly
-        if os.path.exists(report_path):
-            file_size = os.path.getsize(report_path)
+        # Verify the file was created correctly (a single stat gives both existence and size)
+        try:
+            file_size = os.stat(report_path).st_size
+        except OSError:
+            file_size = None
+        
+        if file_size is not None:
             print(f"📏 File size: {file_size} bytes")
             if file_size > 0:
                 print("✅ File created successfully and is not empty")
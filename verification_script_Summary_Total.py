@@ -1,6 +1,62 @@
 import pandas as pd
 import numpy as np
 
+# Header fragments of every standard report column the Summary Total checks look at (compliant
+# status, change reason, case type, primary placement type); exclusion columns are matched below
+_SOURCE_COLUMN_KEYWORDS = ('7 day private visit compliant', '30 day private visit compliant', '90 day visit compliant',
+                           'incorrect change reason', 'case type', 'primary in care placement type')
+
+def _is_source_column(col):
+    """usecols filter that keeps only the standard report columns the find_* helpers can return"""
+    col_lower = str(col).strip().lower()
+    if 'exclusion' in col_lower and 'closed prior to due date' in col_lower:
+        return True
+    return any(keyword in col_lower for keyword in _SOURCE_COLUMN_KEYWORDS)
+
+def _lower_text(values):
+    """Lowercase a column's text cells for comparison with lowercase literals"""
+    # Blank and non-text cells become NaN, which never equals a literal, so there is no need
+    # to fillna('') and cast the whole column to str first
+    if values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+        return values.str.lower()
+    # Numeric, date or all-blank columns hold no text at all
+    return pd.Series(np.nan, index=values.index, dtype=object)
+
+def _canonical_case_types(values):
+    """Lowercase a Case Type column and map the short name 'fcc' to 'formal customary care'"""
+    return _lower_text(values).replace({'fcc': 'formal customary care'})
+
+# Summary Total cells the checks read: rows 1-37 (the last section is row 37), columns A-E
+_SUMMARY_ROWS = 37
+_SUMMARY_COLUMNS = 5
+
+def _is_summary_column(col):
+    """usecols filter for the Summary Total sheet (read with header=None, so columns are positions)"""
+    return col < _SUMMARY_COLUMNS
+
+def _summary_columns(summary_df):
+    """Split the Summary Total sheet into per-column arrays for fast cell lookups"""
+    return [summary_df[col].to_numpy() for col in summary_df.columns]
+
+def _summary_value(summary_values, row, col):
+    """Read a Summary Total cell (blank or non-numeric cells count as 0); None if it is outside the sheet"""
+    if col >= len(summary_values) or row >= len(summary_values[col]):
+        return None
+    value = summary_values[col][row]
+    # Handle NaN values and convert to appropriate type
+    if pd.isna(value):
+        return 0
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0
+
+def _case_type_count(case_type_counts, case_type):
+    """Look up a case type in a value_counts() dict"""
+    return int(case_type_counts.get(case_type, 0))
+
 def verify_summary_total_counts(verification_path):
     """
     Verify the counts in Summary Total sheet for all sections:
@@ -14,76 +70,89 @@ def verify_summary_total_counts(verification_path):
     - Row 37: Kinship Service Cases - 90 Day Visits with Placement Type Other (Standard 3 Report, Kinship only)
     """
     try:
-        # Read all three standard reports
-        print("Reading Standard 1 Report...")
-        std1_df = pd.read_excel(verification_path, sheet_name="Standard 1 Report", header=1)
-        print("Reading Standard 2 Report...")
-        std2_df = pd.read_excel(verification_path, sheet_name="Standard 2 Report", header=1)
-        print("Reading Standard 3 Report...")
-        std3_df = pd.read_excel(verification_path, sheet_name="Standard 3 Report", header=1)
-        
-        # Clean column names by stripping whitespace for all reports
-        std1_df.columns = [str(col).strip() for col in std1_df.columns]
-        std2_df.columns = [str(col).strip() for col in std2_df.columns]
-        std3_df.columns = [str(col).strip() for col in std3_df.columns]
-        
-        print("Finding required columns...")
-        # Find required columns for each report
-        columns_std1 = find_required_columns(std1_df, '7 day private visit compliant')
-        columns_std2 = find_required_columns(std2_df, '30 day private visit compliant')
-        columns_std3 = find_required_columns(std3_df, '90 day visit compliant')
-        
-        # Check if all required columns are found
-        for report_name, columns in [('Standard 1', columns_std1), 
-                                   ('Standard 2', columns_std2), 
-                                   ('Standard 3', columns_std3)]:
-            missing = [k for k, v in columns.items() if v is None]
-            if missing:
-                return {"error": f"Missing columns in {report_name}: {missing}"}
-        
-        # Read the Summary Total sheet
-        print("Reading Summary Total sheet...")
-        summary_df = pd.read_excel(verification_path, sheet_name="Summary Total", header=None)
+        # Open the workbook once; every sheet below is parsed from the same handle instead of
+        # re-opening and re-reading the file for each pd.read_excel call
+        with pd.ExcelFile(verification_path) as xl:
+            # Read all three standard reports, skipping the columns no check uses
+            print("Reading Standard 1 Report...")
+            std1_df = xl.parse(sheet_name="Standard 1 Report", header=1, usecols=_is_source_column)
+            print("Reading Standard 2 Report...")
+            std2_df = xl.parse(sheet_name="Standard 2 Report", header=1, usecols=_is_source_column)
+            print("Reading Standard 3 Report...")
+            std3_df = xl.parse(sheet_name="Standard 3 Report", header=1, usecols=_is_source_column)
+            
+            # Clean column names by stripping whitespace for all reports
+            std1_df.columns = [str(col).strip() for col in std1_df.columns]
+            std2_df.columns = [str(col).strip() for col in std2_df.columns]
+            std3_df.columns = [str(col).strip() for col in std3_df.columns]
+            
+            print("Finding required columns...")
+            # Find required columns (and the exclusion/placement/case type columns the sections
+            # use) for each report, one pass over each header
+            columns_std1, other_std1 = find_report_columns(std1_df, '7 day private visit compliant', '7 day')
+            columns_std2, other_std2 = find_report_columns(std2_df, '30 day private visit compliant', '30 day')
+            columns_std3, other_std3 = find_report_columns(std3_df, '90 day visit compliant', '90 day')
+            
+            # Check if all required columns are found
+            for report_name, columns in [('Standard 1', columns_std1), 
+                                       ('Standard 2', columns_std2), 
+                                       ('Standard 3', columns_std3)]:
+                missing = [k for k, v in columns.items() if v is None]
+                if missing:
+                    return {"error": f"Missing columns in {report_name}: {missing}"}
+            
+            # Read the Summary Total sheet
+            print("Reading Summary Total sheet...")
+            summary_df = xl.parse(sheet_name="Summary Total", header=None, nrows=_SUMMARY_ROWS,
+                                  usecols=_is_summary_column)
+        
+        # The sections below look up single cells; pull each column out as an array once
+        summary_values = _summary_columns(summary_df)
         
         # Verify 7-day visits (Rows 3-6) from Standard 1 Report
         print("Verifying 7-day visits...")
-        results_7day = verify_visit_section(std1_df, columns_std1, summary_df, 
+        results_7day = verify_visit_section(std1_df, columns_std1, summary_values, 
                                            start_row=2, end_row=5, section_name="7-day")
         
         # Verify 30-day visits (Rows 8-11) from Standard 2 Report
         print("Verifying 30-day visits...")
-        results_30day = verify_visit_section(std2_df, columns_std2, summary_df,
+        results_30day = verify_visit_section(std2_df, columns_std2, summary_values,
                                             start_row=7, end_row=10, section_name="30-day")
         
         # Verify 90-day visits (Rows 13-16) from Standard 3 Report
         print("Verifying 90-day visits...")
-        results_90day = verify_visit_section(std3_df, columns_std3, summary_df,
+        results_90day = verify_visit_section(std3_df, columns_std3, summary_values,
                                             start_row=12, end_row=15, section_name="90-day")
         
         # Verify Whereabouts Unknown section (Rows 19-21) from all reports
         print("Verifying Whereabouts Unknown section...")
         results_whereabouts = verify_whereabouts_unknown_section(std1_df, std2_df, std3_df, 
                                                                 columns_std1, columns_std2, columns_std3,
-                                                                summary_df, start_row=18, end_row=20)
+                                                                summary_values, start_row=18,
+                                                                placement_cols=(other_std1['placement_col'],
+                                                                                other_std2['placement_col'],
+                                                                                other_std3['placement_col']))
         
         # Verify Exclusion - Service Ended section (Rows 24-26) from all reports
         print("Verifying Exclusion - Service Ended section...")
         results_exclusion_service = verify_exclusion_service_ended_section(std1_df, std2_df, std3_df, 
-                                                                          summary_df, start_row=23, end_row=25)
+                                                                          summary_values, start_row=23,
+                                                                          report_columns=(other_std1, other_std2, other_std3))
         
         # Verify Exclusion - Data Entry Issue section (Rows 29-31) from all reports
         print("Verifying Exclusion - Data Entry Issue section...")
         results_exclusion_data = verify_exclusion_data_entry_section(std1_df, std2_df, std3_df, 
                                                                     columns_std1, columns_std2, columns_std3,
-                                                                    summary_df, start_row=28, end_row=30)
+                                                                    summary_values, start_row=28)
         
         # Verify For Information Only section (Row 34) from Standard 3 Report
         print("Verifying For Information Only section...")
-        results_information = verify_information_only_section(std3_df, columns_std3, summary_df, start_row=33)
+        results_information = verify_information_only_section(std3_df, columns_std3, summary_values, start_row=33)
         
         # Verify Kinship Service Cases section (Row 37) from Standard 3 Report
         print("Verifying Kinship Service Cases section...")
-        results_kinship = verify_kinship_service_cases_section(std3_df, columns_std3, summary_df, start_row=36)
+        results_kinship = verify_kinship_service_cases_section(std3_df, columns_std3, summary_values, start_row=36,
+                                                               placement_col=other_std3['placement_col'])
         
         # Combine all results
         all_results = {**results_7day, **results_30day, **results_90day, 
@@ -96,12 +165,13 @@ def verify_summary_total_counts(verification_path):
         import traceback
         return {"error": f"Error verifying Summary Total counts: {str(e)}\n{traceback.format_exc()}"}
 
-def verify_kinship_service_cases_section(std3_df, columns_std3, summary_df, start_row):
+def verify_kinship_service_cases_section(std3_df, columns_std3, summary_values, start_row, placement_col=None):
     """Verify the Kinship Service Cases section (row 37) - 90 Day Visits with Placement Type Other (Kinship only)"""
     results = {}
     
-    # Find primary placement column
-    placement_col = find_primary_placement_column(std3_df)
+    # Find primary placement column (unless the caller already resolved it)
+    if placement_col is None:
+        placement_col = find_primary_placement_column(std3_df)
     if not placement_col:
         return {"kinship_error": "Primary Placement Type column not found in Standard 3 Report"}
     
@@ -115,52 +185,37 @@ def verify_kinship_service_cases_section(std3_df, columns_std3, summary_df, star
     
     current_row = start_row
     
+    # Clean and prepare data for comparison (once, not per case type). Case types are matched
+    # by their exact name here, so 'fcc' is not mapped like in the other sections
+    case_type_lower = _lower_text(std3_df[columns_std3['case_type_col']])
+    compliant_data = std3_df[columns_std3['compliant_col']]
+    
+    # Filter for Incorrect Change Reason = 'No'
+    change_reason_filter = _lower_text(std3_df[columns_std3['change_reason_col']]) == 'no'
+    
+    # Filter for Compliant or Not Compliant status
+    compliant_filter = compliant_data.isin(['Compliant', 'Not Compliant'])
+    
+    # Filter for Placement Type = 'Other'
+    placement_filter = _lower_text(std3_df[placement_col]) == 'other'
+    
+    # Count every case type under the combined filters in one pass
+    case_type_counts = case_type_lower[change_reason_filter & compliant_filter & placement_filter].value_counts().to_dict()
+    case_type_totals = None  # all rows per case type, only counted for DEBUG output
+    
     for col_letter, (case_type, col_index) in case_types.items():
         cell_name = f"{col_letter}{current_row + 1}"  # Excel rows are 1-indexed
         
-        # Clean and prepare data for comparison
-        case_type_data = std3_df[columns_std3['case_type_col']].fillna('').astype(str)
-        change_reason_data = std3_df[columns_std3['change_reason_col']].fillna('').astype(str)
-        compliant_data = std3_df[columns_std3['compliant_col']].fillna('').astype(str)
-        placement_data = std3_df[placement_col].fillna('').astype(str)
-        
-        # For Kinship Service, check the case type
-        if case_type == 'kinship service':
-            case_filter = case_type_data.str.lower() == 'kinship service'
-        else:
-            case_filter = case_type_data.str.lower() == case_type
-        
-        # Filter for Incorrect Change Reason = 'No'
-        change_reason_filter = change_reason_data.str.lower() == 'no'
-        
-        # Filter for Compliant or Not Compliant status
-        compliant_filter = compliant_data.isin(['Compliant', 'Not Compliant'])
-        
-        # Filter for Placement Type = 'Other'
-        placement_filter = placement_data.str.lower() == 'other'
-        
         # This section is only for Kinship Service (column E), other columns should be 0
         if case_type == 'kinship service':
             # Count Kinship records with all filters applied
-            calculated_value = len(std3_df[case_filter & change_reason_filter & compliant_filter & placement_filter])
+            calculated_value = _case_type_count(case_type_counts, case_type)
         else:
             # Other case types (CIC, Adoption, FCC) should be 0 for this section
             calculated_value = 0
         
         # Get actual value from summary sheet
-        actual_value = None
-        if current_row < len(summary_df) and col_index < len(summary_df.columns):
-            actual_value = summary_df.iloc[current_row, col_index]
-            # Handle NaN values and convert to appropriate type
-            if pd.isna(actual_value):
-                actual_value = 0
-            elif isinstance(actual_value, (int, float)):
-                pass
-            else:
-                try:
-                    actual_value = float(actual_value)
-                except (ValueError, TypeError):
-                    actual_value = 0
+        actual_value = _summary_value(summary_values, current_row, col_index)
         
         # Compare calculated vs actual values
         match = int(calculated_value) == int(actual_value) if actual_value is not None else False
@@ -178,16 +233,18 @@ def verify_kinship_service_cases_section(std3_df, columns_std3, summary_df, star
         # Debug output for troubleshooting
         if not match:
             print(f"DEBUG {cell_name}: case_type='{case_type}', calculated={calculated_value}, actual={actual_value}")
-            total_kinship_cases = len(std3_df[case_filter])
-            total_correct_reason = len(std3_df[change_reason_filter])
-            total_compliant_not = len(std3_df[compliant_filter])
-            total_other_placement = len(std3_df[placement_filter])
+            if case_type_totals is None:
+                case_type_totals = case_type_lower.value_counts().to_dict()
+            total_kinship_cases = _case_type_count(case_type_totals, case_type)
+            total_correct_reason = int(change_reason_filter.sum())
+            total_compliant_not = int(compliant_filter.sum())
+            total_other_placement = int(placement_filter.sum())
             print(f"DEBUG Total Kinship cases: {total_kinship_cases}, Correct Change Reason: {total_correct_reason}")
             print(f"DEBUG Compliant/Not Compliant: {total_compliant_not}, Other Placement: {total_other_placement}")
     
     return results
 
-def verify_information_only_section(std3_df, columns_std3, summary_df, start_row):
+def verify_information_only_section(std3_df, columns_std3, summary_values, start_row):
     """Verify the For Information Only section (row 34) - Incomplete 90 Day Visits (FCC only)"""
     results = {}
     
@@ -201,44 +258,29 @@ def verify_information_only_section(std3_df, columns_std3, summary_df, start_row
     
     current_row = start_row
     
+    # Clean and prepare data for comparison (once, not per case type)
+    case_type_lower = _canonical_case_types(std3_df[columns_std3['case_type_col']])
+    
+    # Filter for Incomplete status
+    incomplete_filter = _lower_text(std3_df[columns_std3['compliant_col']]) == 'incomplete'
+    
+    # Count every case type with Incomplete status in one pass
+    case_type_counts = case_type_lower[incomplete_filter].value_counts().to_dict()
+    case_type_totals = None  # all rows per case type, only counted for DEBUG output
+    
     for col_letter, (case_type, col_index) in case_types.items():
         cell_name = f"{col_letter}{current_row + 1}"  # Excel rows are 1-indexed
         
-        # Clean and prepare data for comparison
-        case_type_data = std3_df[columns_std3['case_type_col']].fillna('').astype(str)
-        compliant_data = std3_df[columns_std3['compliant_col']].fillna('').astype(str)
-        
-        # For FCC/Formal Customary Care, check both possible names
-        if case_type == 'formal customary care':
-            case_filter = case_type_data.str.lower().isin(['fcc', 'formal customary care'])
-        else:
-            case_filter = case_type_data.str.lower() == case_type
-        
-        # Filter for Incomplete status
-        incomplete_filter = compliant_data.str.lower() == 'incomplete'
-        
         # This section is only for FCC (column D), other columns should be 0
         if case_type == 'formal customary care':
             # Count FCC records with Incomplete status
-            calculated_value = len(std3_df[case_filter & incomplete_filter])
+            calculated_value = _case_type_count(case_type_counts, case_type)
         else:
             # Other case types (CIC, Adoption, Kinship) should be 0 for this section
             calculated_value = 0
         
         # Get actual value from summary sheet
-        actual_value = None
-        if current_row < len(summary_df) and col_index < len(summary_df.columns):
-            actual_value = summary_df.iloc[current_row, col_index]
-            # Handle NaN values and convert to appropriate type
-            if pd.isna(actual_value):
-                actual_value = 0
-            elif isinstance(actual_value, (int, float)):
-                pass
-            else:
-                try:
-                    actual_value = float(actual_value)
-                except (ValueError, TypeError):
-                    actual_value = 0
+        actual_value = _summary_value(summary_values, current_row, col_index)
         
         # Compare calculated vs actual values
         match = int(calculated_value) == int(actual_value) if actual_value is not None else False
@@ -256,14 +298,16 @@ def verify_information_only_section(std3_df, columns_std3, summary_df, start_row
         # Debug output for troubleshooting
         if not match:
             print(f"DEBUG {cell_name}: case_type='{case_type}', calculated={calculated_value}, actual={actual_value}")
-            total_fcc_cases = len(std3_df[case_filter])
-            total_incomplete = len(std3_df[incomplete_filter])
+            if case_type_totals is None:
+                case_type_totals = case_type_lower.value_counts().to_dict()
+            total_fcc_cases = _case_type_count(case_type_totals, case_type)
+            total_incomplete = int(incomplete_filter.sum())
             print(f"DEBUG Total FCC cases: {total_fcc_cases}, Total Incomplete: {total_incomplete}")
     
     return results
 
 def verify_exclusion_data_entry_section(std1_df, std2_df, std3_df, columns_std1, columns_std2, columns_std3,
-                                       summary_df, start_row, end_row):
+                                       summary_values, start_row):
     """Verify the Exclusion - Data Entry Issue section (rows 29-31)"""
     results = {}
     
@@ -283,47 +327,32 @@ def verify_exclusion_data_entry_section(std1_df, std2_df, std3_df, columns_std1,
     ]):
         current_row = start_row + row_offset
         
+        # Clean and prepare data for comparison (once per report, not per case type)
+        case_type_lower = _canonical_case_types(report_df[columns['case_type_col']])
+        compliant_data = report_df[columns['compliant_col']]
+        
+        # Filter for Incorrect Change Reason = 'Yes'
+        incorrect_reason_filter = _lower_text(report_df[columns['change_reason_col']]) == 'yes'
+        
+        # Filter for records that have compliant data (not null/empty)
+        compliant_filter = compliant_data.notna() & (compliant_data != '')
+        
+        # Count every case type under both filters in one pass
+        case_type_counts = case_type_lower[incorrect_reason_filter & compliant_filter].value_counts().to_dict()
+        case_type_totals = None  # all rows per case type, only counted for DEBUG output
+        
         for col_letter, (case_type, col_index) in case_types.items():
             cell_name = f"{col_letter}{current_row + 1}"  # Excel rows are 1-indexed
             
-            # Clean and prepare data for comparison
-            case_type_data = report_df[columns['case_type_col']].fillna('').astype(str)
-            change_reason_data = report_df[columns['change_reason_col']].fillna('').astype(str)
-            compliant_data = report_df[columns['compliant_col']].fillna('').astype(str)
-            
-            # For FCC/Formal Customary Care, check both possible names
-            if case_type == 'formal customary care':
-                case_filter = case_type_data.str.lower().isin(['fcc', 'formal customary care'])
-            else:
-                case_filter = case_type_data.str.lower() == case_type
-            
-            # Filter for Incorrect Change Reason = 'Yes'
-            incorrect_reason_filter = change_reason_data.str.lower() == 'yes'
-            
-            # Filter for records that have compliant data (not null/empty)
-            compliant_filter = compliant_data.notna() & (compliant_data != '')
-            
             # For 90-day visits, exclude CIC
             if report_name == '90-day' and case_type == 'child in care':
                 calculated_value = 0  # CIC excluded from 90-day visits
             else:
                 # Count records with Incorrect Change Reason = 'Yes' that have compliant data
-                calculated_value = len(report_df[case_filter & incorrect_reason_filter & compliant_filter])
+                calculated_value = _case_type_count(case_type_counts, case_type)
             
             # Get actual value from summary sheet
-            actual_value = None
-            if current_row < len(summary_df) and col_index < len(summary_df.columns):
-                actual_value = summary_df.iloc[current_row, col_index]
-                # Handle NaN values and convert to appropriate type
-                if pd.isna(actual_value):
-                    actual_value = 0
-                elif isinstance(actual_value, (int, float)):
-                    pass
-                else:
-                    try:
-                        actual_value = float(actual_value)
-                    except (ValueError, TypeError):
-                        actual_value = 0
+            actual_value = _summary_value(summary_values, current_row, col_index)
             
             # Compare calculated vs actual values
             match = int(calculated_value) == int(actual_value) if actual_value is not None else False
@@ -341,21 +370,26 @@ def verify_exclusion_data_entry_section(std1_df, std2_df, std3_df, columns_std1,
             # Debug output for troubleshooting
             if not match:
                 print(f"DEBUG {cell_name}: case_type='{case_type}', calculated={calculated_value}, actual={actual_value}")
-                total_cases = len(report_df[case_filter])
-                total_incorrect_reason = len(report_df[incorrect_reason_filter])
-                total_with_compliant = len(report_df[compliant_filter])
+                if case_type_totals is None:
+                    case_type_totals = case_type_lower.value_counts().to_dict()
+                total_cases = _case_type_count(case_type_totals, case_type)
+                total_incorrect_reason = int(incorrect_reason_filter.sum())
+                total_with_compliant = int(compliant_filter.sum())
                 print(f"DEBUG Total cases: {total_cases}, Incorrect Change Reason: {total_incorrect_reason}, With Compliant Data: {total_with_compliant}")
     
     return results
 
-def verify_exclusion_service_ended_section(std1_df, std2_df, std3_df, summary_df, start_row, end_row):
+def verify_exclusion_service_ended_section(std1_df, std2_df, std3_df, summary_values, start_row, report_columns=None):
     """Verify the Exclusion - Service Ended section (rows 24-26)"""
     results = {}
     
-    # Find exclusion columns in each report
-    exclusion_col_std1 = find_exclusion_column(std1_df, '7 day')
-    exclusion_col_std2 = find_exclusion_column(std2_df, '30 day')
-    exclusion_col_std3 = find_exclusion_column(std3_df, '90 day')
+    # Find exclusion and case type columns in each report (unless the caller already resolved
+    # them with find_report_columns)
+    if report_columns is None:
+        report_columns = tuple({'exclusion_col': find_exclusion_column(df, visit_type),
+                                'case_type_col': find_case_type_column(df)}
+                               for df, visit_type in [(std1_df, '7 day'), (std2_df, '30 day'), (std3_df, '90 day')])
+    exclusion_col_std1, exclusion_col_std2, exclusion_col_std3 = (columns['exclusion_col'] for columns in report_columns)
     
     if not exclusion_col_std1:
         return {"exclusion_error": "7 Day Private Visit Exclusion column not found in Standard 1 Report"}
@@ -373,50 +407,35 @@ def verify_exclusion_service_ended_section(std1_df, std2_df, std3_df, summary_df
     }
     
     # For each row in the section (7-day, 30-day, 90-day)
-    for row_offset, (report_df, exclusion_col, report_name) in enumerate([
-        (std1_df, exclusion_col_std1, '7-day'),
-        (std2_df, exclusion_col_std2, '30-day'),
-        (std3_df, exclusion_col_std3, '90-day')
+    for row_offset, (report_df, exclusion_col, case_type_col, report_name) in enumerate([
+        (std1_df, exclusion_col_std1, report_columns[0]['case_type_col'], '7-day'),
+        (std2_df, exclusion_col_std2, report_columns[1]['case_type_col'], '30-day'),
+        (std3_df, exclusion_col_std3, report_columns[2]['case_type_col'], '90-day')
     ]):
         current_row = start_row + row_offset
         
+        # Clean and prepare data for comparison (once per report, not per case type)
+        case_type_lower = _canonical_case_types(report_df[case_type_col])
+        
+        # Exclusion filter - count "Yes" values
+        exclusion_filter = _lower_text(report_df[exclusion_col]) == 'yes'
+        
+        # Count every case type with Exclusion = "Yes" in one pass
+        case_type_counts = case_type_lower[exclusion_filter].value_counts().to_dict()
+        case_type_totals = None  # all rows per case type, only counted for DEBUG output
+        
         for col_letter, (case_type, col_index) in case_types.items():
             cell_name = f"{col_letter}{current_row + 1}"  # Excel rows are 1-indexed
             
-            # Clean and prepare data for comparison
-            case_type_data = report_df[find_case_type_column(report_df)].fillna('').astype(str)
-            exclusion_data = report_df[exclusion_col].fillna('').astype(str)
-            
-            # For FCC/Formal Customary Care, check both possible names
-            if case_type == 'formal customary care':
-                case_filter = case_type_data.str.lower().isin(['fcc', 'formal customary care'])
-            else:
-                case_filter = case_type_data.str.lower() == case_type
-            
-            # Exclusion filter - count "Yes" values
-            exclusion_filter = exclusion_data.str.lower() == 'yes'
-            
             # For 90-day visits, exclude CIC
             if report_name == '90-day' and case_type == 'child in care':
                 calculated_value = 0  # CIC excluded from 90-day visits
             else:
                 # Count records with Exclusion = "Yes"
-                calculated_value = len(report_df[case_filter & exclusion_filter])
+                calculated_value = _case_type_count(case_type_counts, case_type)
             
             # Get actual value from summary sheet
-            actual_value = None
-            if current_row < len(summary_df) and col_index < len(summary_df.columns):
-                actual_value = summary_df.iloc[current_row, col_index]
-                # Handle NaN values and convert to appropriate type
-                if pd.isna(actual_value):
-                    actual_value = 0
-                elif isinstance(actual_value, (int, float)):
-                    pass
-                else:
-                    try:
-                        actual_value = float(actual_value)
-                    except (ValueError, TypeError):
-                        actual_value = 0
+            actual_value = _summary_value(summary_values, current_row, col_index)
             
             # Compare calculated vs actual values
             match = int(calculated_value) == int(actual_value) if actual_value is not None else False
@@ -434,28 +453,35 @@ def verify_exclusion_service_ended_section(std1_df, std2_df, std3_df, summary_df
             # Debug output for troubleshooting
             if not match:
                 print(f"DEBUG {cell_name}: case_type='{case_type}', exclusion_col='{exclusion_col}', calculated={calculated_value}, actual={actual_value}")
-                total_cases = len(report_df[case_filter])
-                total_exclusions = len(report_df[exclusion_filter])
+                if case_type_totals is None:
+                    case_type_totals = case_type_lower.value_counts().to_dict()
+                total_cases = _case_type_count(case_type_totals, case_type)
+                total_exclusions = int(exclusion_filter.sum())
                 print(f"DEBUG Total cases: {total_cases}, Total exclusions: {total_exclusions}")
     
     return results
 
+def _is_exclusion_column(col_lower, visit_type):
+    """Check a lowercased header against the exclusion column pattern for the visit type"""
+    # Check if it's an exclusion column with the right pattern
+    if 'exclusion' in col_lower and 'closed prior to due date' in col_lower:
+        # For 7-day visits
+        if visit_type == '7 day' and '7' in col_lower:
+            return True
+        # For 30-day visits  
+        elif visit_type == '30 day' and '30' in col_lower:
+            return True
+        # For 90-day visits
+        elif visit_type == '90 day' and '90' in col_lower:
+            return True
+    return False
+
 def find_exclusion_column(df, visit_type):
     """Find the exclusion column for the specified visit type"""
     # More flexible matching for exclusion columns
     for col in df.columns:
-        col_lower = str(col).lower()
-        # Check if it's an exclusion column with the right pattern
-        if 'exclusion' in col_lower and 'closed prior to due date' in col_lower:
-            # For 7-day visits
-            if visit_type == '7 day' and '7' in col_lower:
-                return col
-            # For 30-day visits  
-            elif visit_type == '30 day' and '30' in col_lower:
-                return col
-            # For 90-day visits
-            elif visit_type == '90 day' and '90' in col_lower:
-                return col
+        if _is_exclusion_column(str(col).lower(), visit_type):
+            return col
                 
     return None
 
@@ -468,14 +494,14 @@ def find_case_type_column(df):
     return None
 
 def verify_whereabouts_unknown_section(std1_df, std2_df, std3_df, columns_std1, columns_std2, columns_std3, 
-                                      summary_df, start_row, end_row):
+                                      summary_values, start_row, placement_cols=None):
     """Verify the Whereabouts Unknown section (rows 19-21)"""
     results = {}
     
-    # Find primary placement column in each report
-    placement_col_std1 = find_primary_placement_column(std1_df)
-    placement_col_std2 = find_primary_placement_column(std2_df)
-    placement_col_std3 = find_primary_placement_column(std3_df)
+    # Find primary placement column in each report (unless the caller already resolved them)
+    if placement_cols is None:
+        placement_cols = tuple(find_primary_placement_column(df) for df in (std1_df, std2_df, std3_df))
+    placement_col_std1, placement_col_std2, placement_col_std3 = placement_cols
     
     if not placement_col_std1:
         return {"whereabouts_error": "Primary Placement Type column not found in Standard 1 Report"}
@@ -500,47 +526,31 @@ def verify_whereabouts_unknown_section(std1_df, std2_df, std3_df, columns_std1,
     ]):
         current_row = start_row + row_offset
         
+        # Filter data: Incorrect Change Reason = 'No' (once per report, not per case type); kept as
+        # a mask and combined below instead of copying the filtered report
+        change_reason_filter = _lower_text(report_df[columns['change_reason_col']]) == 'no'
+        
+        # Clean and prepare data for comparison
+        case_type_lower = _canonical_case_types(report_df[columns['case_type_col']])
+        
+        # Whereabouts Unknown filter
+        whereabouts_filter = _lower_text(report_df[placement_col_std1]) == 'whereabouts unknown'
+        
+        # Count every case type with Whereabouts Unknown placement in one pass
+        case_type_counts = case_type_lower[change_reason_filter & whereabouts_filter].value_counts().to_dict()
+        
         for col_letter, (case_type, col_index) in case_types.items():
             cell_name = f"{col_letter}{current_row + 1}"  # Excel rows are 1-indexed
             
-            # Filter data: Incorrect Change Reason = 'No'
-            change_reason_data = report_df[columns['change_reason_col']].fillna('').astype(str)
-            filtered_df = report_df[change_reason_data.str.lower() == 'no']
-            
-            # Clean and prepare data for comparison
-            case_type_data = filtered_df[columns['case_type_col']].fillna('').astype(str)
-            placement_data = filtered_df[placement_col_std1].fillna('').astype(str)
-            
-            # For FCC/Formal Customary Care, check both possible names
-            if case_type == 'formal customary care':
-                case_filter = case_type_data.str.lower().isin(['fcc', 'formal customary care'])
-            else:
-                case_filter = case_type_data.str.lower() == case_type
-            
-            # Whereabouts Unknown filter
-            whereabouts_filter = placement_data.str.lower() == 'whereabouts unknown'
-            
             # For 90-day visits, exclude CIC
             if report_name == '90-day' and case_type == 'child in care':
                 calculated_value = 0  # CIC excluded from 90-day visits
             else:
                 # Count records with Whereabouts Unknown placement type
-                calculated_value = len(filtered_df[case_filter & whereabouts_filter])
+                calculated_value = _case_type_count(case_type_counts, case_type)
             
             # Get actual value from summary sheet
-            actual_value = None
-            if current_row < len(summary_df) and col_index < len(summary_df.columns):
-                actual_value = summary_df.iloc[current_row, col_index]
-                # Handle NaN values and convert to appropriate type
-                if pd.isna(actual_value):
-                    actual_value = 0
-                elif isinstance(actual_value, (int, float)):
-                    pass
-                else:
-                    try:
-                        actual_value = float(actual_value)
-                    except (ValueError, TypeError):
-                        actual_value = 0
+            actual_value = _summary_value(summary_values, current_row, col_index)
             
             # Compare calculated vs actual values
             match = int(calculated_value) == int(actual_value) if actual_value is not None else False
@@ -584,15 +594,51 @@ def find_required_columns(df, compliant_pattern):
     
     return columns_needed
 
-def verify_visit_section(df, columns, summary_df, start_row, end_row, section_name):
+def find_report_columns(df, compliant_pattern, visit_type):
+    """
+    Resolve every column the Summary Total checks use in a single pass over the headers.
+    Returns the find_required_columns() dict plus a dict with the exclusion, primary placement
+    and case type columns as find_exclusion_column/find_primary_placement_column/
+    find_case_type_column would return them (first match wins for those three).
+    """
+    columns_needed = {
+        'compliant_col': None,
+        'change_reason_col': None,
+        'case_type_col': None
+    }
+    other_columns = {
+        'exclusion_col': None,
+        'placement_col': None,
+        'case_type_col': None
+    }
+    
+    for col in df.columns:
+        col_lower = str(col).lower()
+        # Same rules and precedence as find_required_columns (last match wins)
+        if compliant_pattern in col_lower:
+            columns_needed['compliant_col'] = col
+        elif 'incorrect change reason' in col_lower:
+            columns_needed['change_reason_col'] = col
+        elif 'case type' in col_lower:
+            columns_needed['case_type_col'] = col
+        
+        if other_columns['exclusion_col'] is None and _is_exclusion_column(col_lower, visit_type):
+            other_columns['exclusion_col'] = col
+        if other_columns['placement_col'] is None and 'primary in care placement type' in col_lower:
+            other_columns['placement_col'] = col
+        if other_columns['case_type_col'] is None and 'case type' in col_lower:
+            other_columns['case_type_col'] = col
+    
+    return columns_needed, other_columns
+
+def verify_visit_section(df, columns, summary_values, start_row, end_row, section_name):
     """Verify a specific visit section in the summary sheet"""
     results = {}
     
     print(f"Verifying {section_name} section, rows {start_row+1} to {end_row+1}")
     
     # Filter data: Incorrect Change Reason = 'No'
-    change_reason_data = df[columns['change_reason_col']].fillna('').astype(str)
-    filtered_df = df[change_reason_data.str.lower() == 'no']
+    filtered_df = df[_lower_text(df[columns['change_reason_col']]) == 'no']
     
     print(f"Filtered data size: {len(filtered_df)} (original: {len(df)})")
     
@@ -607,6 +653,24 @@ def verify_visit_section(df, columns, summary_df, start_row, end_row, section_na
         'E': ('kinship service', 4) # Column E = index 4
     }
     
+    # Clean and prepare data for comparison (once, not per cell)
+    case_type_lower = _canonical_case_types(filtered_df[columns['case_type_col']])
+    compliant_data = filtered_df[columns['compliant_col']]
+    
+    # Compliant status filters for each row type (90-day visits also count Incomplete)
+    if section_name == '90-day':
+        total_filter = compliant_data.isin(['Compliant', 'Not Compliant', 'Incomplete'])
+        non_compliant_filter = compliant_data.isin(['Not Compliant', 'Incomplete'])
+    else:
+        total_filter = compliant_data.isin(['Compliant', 'Not Compliant'])
+        non_compliant_filter = compliant_data == 'Not Compliant'
+    compliant_filter = compliant_data == 'Compliant'
+    
+    # Count every case type under each filter in one pass; the cells below are lookups
+    total_counts = case_type_lower[total_filter].value_counts().to_dict()
+    compliant_counts = case_type_lower[compliant_filter].value_counts().to_dict()
+    non_compliant_counts = case_type_lower[non_compliant_filter].value_counts().to_dict()
+    
     # For each row in the section (Total, Compliant, Non-Compliant, Compliance Rate)
     for row_offset, row_type in enumerate(['total', 'compliant', 'non_compliant', 'compliance_rate']):
         current_row = start_row + row_offset
@@ -614,58 +678,23 @@ def verify_visit_section(df, columns, summary_df, start_row, end_row, section_na
         for col_letter, (case_type, col_index) in case_types.items():
             cell_name = f"{col_letter}{current_row + 1}"  # Excel rows are 1-indexed
             
-            # Clean and prepare data for comparison
-            case_type_data = filtered_df[columns['case_type_col']].fillna('').astype(str)
-            compliant_data = filtered_df[columns['compliant_col']].fillna('').astype(str)
-            
-            # For FCC/Formal Customary Care, check both possible names
-            if case_type == 'formal customary care':
-                case_filter = case_type_data.str.lower().isin(['fcc', 'formal customary care'])
-            else:
-                case_filter = case_type_data.str.lower() == case_type
-            
             # Calculate expected value based on row type
             if row_type == 'total':
-                if section_name == '90-day':
-                    compliant_filter = compliant_data.isin(['Compliant', 'Not Compliant', 'Incomplete'])
-                else:
-                    compliant_filter = compliant_data.isin(['Compliant', 'Not Compliant'])
-                calculated_value = len(filtered_df[case_filter & compliant_filter])
+                calculated_value = _case_type_count(total_counts, case_type)
                 
             elif row_type == 'compliant':
-                compliant_filter = compliant_data == 'Compliant'
-                calculated_value = len(filtered_df[case_filter & compliant_filter])
+                calculated_value = _case_type_count(compliant_counts, case_type)
                 
             elif row_type == 'non_compliant':
-                if section_name == '90-day':
-                    compliant_filter = compliant_data.isin(['Not Compliant', 'Incomplete'])
-                else:
-                    compliant_filter = compliant_data == 'Not Compliant'
-                calculated_value = len(filtered_df[case_filter & compliant_filter])
+                calculated_value = _case_type_count(non_compliant_counts, case_type)
                 
             else:  # compliance_rate
-                if section_name == '90-day':
-                    total_filter = compliant_data.isin(['Compliant', 'Not Compliant', 'Incomplete'])
-                else:
-                    total_filter = compliant_data.isin(['Compliant', 'Not Compliant'])
-                    
-                compliant_filter = compliant_data == 'Compliant'
-                
-                total_count = len(filtered_df[case_filter & total_filter])
-                compliant_count = len(filtered_df[case_filter & compliant_filter])
+                total_count = _case_type_count(total_counts, case_type)
+                compliant_count = _case_type_count(compliant_counts, case_type)
                 calculated_value = compliant_count / total_count if total_count > 0 else 0
             
             # Get actual value from summary sheet
-            actual_value = None
-            if current_row < len(summary_df) and col_index < len(summary_df.columns):
-                actual_value = summary_df.iloc[current_row, col_index]
-                if pd.isna(actual_value):
-                    actual_value = 0
-                elif not isinstance(actual_value, (int, float)):
-                    try:
-                        actual_value = float(actual_value)
-                    except (ValueError, TypeError):
-                        actual_value = 0
+            actual_value = _summary_value(summary_values, current_row, col_index)
             
             # For compliance rate, compare with tolerance
             if row_type == 'compliance_rate' and actual_value is not None: